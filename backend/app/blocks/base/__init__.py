@@ -1,5 +1,6 @@
-# Base block package — exports BaseBlock and BlockResult for use across the entire
-# blocks hierarchy without requiring callers to know the internal file layout.
-from app.blocks.base.base import BaseBlock, BlockResult
+# Base block package — exports BaseBlock, BlockResult and the COLLECT_METADATA
+# switch for use across the entire blocks hierarchy without requiring callers to
+# know the internal file layout.
+from app.blocks.base.base import COLLECT_METADATA, BaseBlock, BlockResult
 
-__all__ = ["BaseBlock", "BlockResult"]
+__all__ = ["BaseBlock", "BlockResult", "COLLECT_METADATA"]
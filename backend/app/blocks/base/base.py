@@ -1,25 +1,140 @@
+import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, ClassVar, Mapping, Optional, Type
 
-class BlockResult(BaseModel):
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Shared read-only config for blocks constructed without one. Being immutable,
+# it can be handed to every such block without the aliasing hazard of a
+# mutable ``{}`` default argument.
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Whether blocks attach a ``metadata`` dict to successful results. Callers that
+# only consume ``value`` can set AETHERLOOM_METADATA=0 to skip building it;
+# ``BlockResult.metadata`` is then ``None``, which consumers already handle.
+COLLECT_METADATA: bool = os.environ.get("AETHERLOOM_METADATA", "1") == "1"
+
+@dataclass(slots=True)
+class BlockResult:
     """
     Standard result format returned by all blocks.
+
+    A slotted dataclass rather than a Pydantic model: one is built for every
+    block execution, and its fields are produced by our own code, so there is
+    nothing to validate.
     """
     success: bool
     value: Any  # computed value for downstream nodes
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        Return the result as a plain dict (same shape as Pydantic's model_dump).
+        """
+        return {
+            "success": self.success,
+            "value": self.value,
+            "error": self.error,
+            "metadata": self.metadata,
+        }
+
 class BaseBlock(ABC):
     """
     Abstract base class for all executable blocks (Inputs, Processors, Outputs).
     All node types must inherit from this class and implement the run() method.
+
+    Blocks that set ``config_model`` get their config validated once, at
+    construction. The parsed model (or the ``ValidationError``) is cached
+    together with the identity of the config it came from, so ``run()`` only
+    re-validates when ``self.config`` has been replaced wholesale.
     """
 
-    def __init__(self, node_id: str, config: Dict[str, Any] = {}):
+    # Pydantic model used to validate ``config``; ``None`` for blocks that read
+    # their config directly.
+    config_model: ClassVar[Optional[Type[BaseModel]]] = None
+
+    # Whether the block needs every upstream node to have succeeded. When one
+    # has failed the executor skips ``run()`` and records a failure instead;
+    # blocks that handle ``None`` inputs sensibly set this to ``False``.
+    requires_all_inputs: ClassVar[bool] = True
+
+    # Whether ``run()`` mostly waits on I/O. The executor runs every other
+    # block inline in the calling thread; only blocks that set this to
+    # ``True`` are handed to its shared worker pool so they can overlap.
+    io_bound: ClassVar[bool] = False
+
+    def __init__(self, node_id: str, config: Optional[Mapping[str, Any]] = None):
         self.node_id = node_id
-        self.config = config
+        self.config = config if config is not None else _EMPTY_CONFIG
+        self._load_config()
+
+    @classmethod
+    def from_trusted_config(cls, node_id: str, config: Mapping[str, Any]) -> "BaseBlock":
+        """Build a block from configuration that is already known to be valid.
+
+        Uses ``config_model.model_construct`` so no validators run. Only use
+        this for config that has been validated before (e.g. when cloning an
+        existing block); untrusted config must go through the constructor.
+
+        Args:
+            node_id: Unique identifier of the node.
+            config: Previously validated configuration dict.
+
+        Returns:
+            A ready-to-run block.
+        """
+        if cls.config_model is None:
+            return cls(node_id, config)
+        block = cls.__new__(cls)
+        block.node_id = node_id
+        block.config = config
+        block._set_config(cls.config_model.model_construct(**config), None)
+        return block
+
+    def _load_config(self) -> None:
+        """Validate ``self.config`` and cache the result on the instance.
+
+        A ``ValidationError`` is cached rather than raised so that ``run()``
+        can report it as a failed ``BlockResult``. Blocks without a
+        ``config_model`` still go through ``_set_config`` so they can derive
+        state from the raw config.
+        """
+        if self.config_model is None:
+            self._set_config(None, None)
+            return
+        try:
+            self._set_config(self.config_model.model_validate(self.config), None)
+        except ValidationError as exc:
+            self._set_config(None, exc)
+
+    def _set_config(
+        self, cfg: Optional[BaseModel], error: Optional[ValidationError]
+    ) -> None:
+        """Store the parsed config (or its validation error) on the instance.
+
+        Subclasses that derive further state from the config extend this and
+        call ``super()._set_config`` first.
+        """
+        self._cfg_source = self.config
+        self._cfg = cfg
+        self._cfg_error = error
+
+    def _invalid_config_result(self, exc: ValidationError) -> BlockResult:
+        """Convert a cached config ``ValidationError`` into a failed result."""
+        logger.error(
+            "%s '%s' invalid configuration: %d error(s).",
+            type(self).__name__,
+            self.node_id,
+            exc.error_count(),
+        )
+        first_msg = exc.errors()[0].get("msg", "Invalid configuration.")
+        return BlockResult(success=False, value=None, error=first_msg)
 
     @abstractmethod
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
@@ -6,13 +6,21 @@ These blocks return configured values without requiring upstream inputs.
 """
 
 import logging
-from typing import Dict, Any
+import math
+from typing import Dict, Any, Optional
 
-from app.blocks.base import BaseBlock, BlockResult
+from pydantic import BaseModel, ValidationError
+
+from app.blocks.base import COLLECT_METADATA, BaseBlock, BlockResult
 
 logger = logging.getLogger(__name__)
 
 
+def _err(message: str) -> BlockResult:
+    """Build a failed ``BlockResult`` carrying *message* as its error."""
+    return BlockResult(success=False, value=None, error=message)
+
+
 class TextInputBlock(BaseBlock):
     """
     Text Input Block - Returns a configured text value.
@@ -26,6 +34,36 @@ class TextInputBlock(BaseBlock):
         BlockResult with the configured text value
     """
     
+    def _set_config(
+        self, cfg: Optional[BaseModel], error: Optional[ValidationError]
+    ) -> None:
+        """Validate the configured text and take its length once per config."""
+        super()._set_config(cfg, error)
+        text_value = self.config.get("value", "")
+        self._text_value = text_value
+        self._length = 0
+        try:
+            if not isinstance(text_value, str):
+                self._value_error = (
+                    f"Text value must be a string, got {type(text_value).__name__}"
+                )
+                return
+            self._length = length = len(text_value)
+            max_length = self.config.get("max_length")
+            if max_length is not None and length > max_length:
+                self._value_error = f"Text length {length} exceeds maximum {max_length}"
+                return
+            self._value_error = None
+        except Exception as e:
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in TextInputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            self._value_error = f"Unexpected error: {str(e)}"
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """
         Execute the text input block.
@@ -37,44 +75,37 @@ class TextInputBlock(BaseBlock):
             BlockResult containing the configured text value
         """
         try:
-            # Get the configured text value
-            text_value = self.config.get("value", "")
-            
-            # Validate it's a string
-            if not isinstance(text_value, str):
-                return BlockResult(
-                    success=False,
-                    value=None,
-                    error=f"Text value must be a string, got {type(text_value).__name__}"
-                )
+            # Type and length checks are cached per config object
+            if self.config is not self._cfg_source:
+                self._load_config()
+            if self._value_error is not None:
+                return _err(self._value_error)
+            text_value = self._text_value
             
-            # Check max_length constraint if configured
-            max_length = self.config.get("max_length")
-            if max_length is not None and len(text_value) > max_length:
-                return BlockResult(
-                    success=False,
-                    value=None,
-                    error=f"Text length {len(text_value)} exceeds maximum {max_length}"
-                )
-            
-            logger.debug(f"TextInputBlock {self.node_id} returning value: {text_value[:50]}...")
+            # %-style args: the message (and the 50-char truncation) is only
+            # built if a handler actually emits DEBUG records.
+            logger.debug(
+                "TextInputBlock %s returning value: %.50s...", self.node_id, text_value
+            )
             
             return BlockResult(
                 success=True,
                 value=text_value,
                 metadata={
-                    "length": len(text_value),
+                    "length": self._length,
                     "multiline": self.config.get("multiline", False)
-                }
+                } if COLLECT_METADATA else None
             )
             
         except Exception as e:
-            logger.error(f"Error in TextInputBlock {self.node_id}: {str(e)}", exc_info=True)
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {str(e)}"
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in TextInputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
+            return _err(f"Unexpected error: {str(e)}")
 
 
 class NumberInputBlock(BaseBlock):
@@ -91,6 +122,76 @@ class NumberInputBlock(BaseBlock):
         BlockResult with the configured numeric value
     """
     
+    def _set_config(
+        self, cfg: Optional[BaseModel], error: Optional[ValidationError]
+    ) -> None:
+        """Convert and range-check the configured value once per config.
+
+        The outcome depends only on ``self.config``, so ``run()`` just reports
+        the cached value or error message.
+        """
+        super()._set_config(cfg, error)
+        self._raw_value = self.config.get("value", 0)
+        self._numeric_value: Any = None
+        try:
+            self._value_error = self._resolve_value(self._raw_value)
+        except Exception as e:
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in NumberInputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            self._value_error = f"Unexpected error: {str(e)}"
+
+    def _resolve_value(self, raw_value: Any) -> Optional[str]:
+        """Store the converted value on the instance; return an error message or ``None``."""
+        # Determine the expected type
+        number_type = self.config.get("number_type", "auto")
+
+        # Convert and validate the value
+        if number_type == "int":
+            try:
+                numeric_value = int(raw_value)
+            except (ValueError, TypeError):
+                return f"Cannot convert '{raw_value}' to integer"
+        elif number_type == "float":
+            try:
+                numeric_value = float(raw_value)
+            except (ValueError, TypeError):
+                return f"Cannot convert '{raw_value}' to float"
+        else:  # auto-detect
+            if isinstance(raw_value, (int, float)):
+                numeric_value = raw_value
+            else:
+                # Try int first, then float. int() rejects anything with a
+                # decimal point or exponent; float() also takes "nan" and
+                # "inf", and overflows "1e999" to inf, so non-finite results
+                # are rejected (NaN would slip past the min/max checks).
+                try:
+                    numeric_value = int(raw_value)
+                except (ValueError, TypeError):
+                    try:
+                        numeric_value = float(raw_value)
+                    except (ValueError, TypeError):
+                        return f"Cannot convert '{raw_value}' to number"
+                    if not math.isfinite(numeric_value):
+                        return f"Cannot convert '{raw_value}' to number"
+
+        # Validate min/max constraints
+        min_value = self.config.get("min_value")
+        max_value = self.config.get("max_value")
+
+        if min_value is not None and numeric_value < min_value:
+            return f"Value {numeric_value} is less than minimum {min_value}"
+
+        if max_value is not None and numeric_value > max_value:
+            return f"Value {numeric_value} exceeds maximum {max_value}"
+
+        self._numeric_value = numeric_value
+        return None
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """
         Execute the number input block.
@@ -102,67 +203,15 @@ class NumberInputBlock(BaseBlock):
             BlockResult containing the configured numeric value
         """
         try:
-            # Get the configured numeric value
-            raw_value = self.config.get("value", 0)
+            # Conversion and range checks are cached per config object
+            if self.config is not self._cfg_source:
+                self._load_config()
+            if self._value_error is not None:
+                return _err(self._value_error)
+            raw_value = self._raw_value
+            numeric_value = self._numeric_value
             
-            # Determine the expected type
-            number_type = self.config.get("number_type", "auto")
-            
-            # Convert and validate the value
-            if number_type == "int":
-                try:
-                    numeric_value = int(raw_value)
-                except (ValueError, TypeError):
-                    return BlockResult(
-                        success=False,
-                        value=None,
-                        error=f"Cannot convert '{raw_value}' to integer"
-                    )
-            elif number_type == "float":
-                try:
-                    numeric_value = float(raw_value)
-                except (ValueError, TypeError):
-                    return BlockResult(
-                        success=False,
-                        value=None,
-                        error=f"Cannot convert '{raw_value}' to float"
-                    )
-            else:  # auto-detect
-                if isinstance(raw_value, (int, float)):
-                    numeric_value = raw_value
-                else:
-                    try:
-                        # Try int first, then float
-                        if '.' in str(raw_value) or 'e' in str(raw_value).lower():
-                            numeric_value = float(raw_value)
-                        else:
-                            numeric_value = int(raw_value)
-                    except (ValueError, TypeError):
-                        return BlockResult(
-                            success=False,
-                            value=None,
-                            error=f"Cannot convert '{raw_value}' to number"
-                        )
-            
-            # Validate min/max constraints
-            min_value = self.config.get("min_value")
-            max_value = self.config.get("max_value")
-            
-            if min_value is not None and numeric_value < min_value:
-                return BlockResult(
-                    success=False,
-                    value=None,
-                    error=f"Value {numeric_value} is less than minimum {min_value}"
-                )
-            
-            if max_value is not None and numeric_value > max_value:
-                return BlockResult(
-                    success=False,
-                    value=None,
-                    error=f"Value {numeric_value} exceeds maximum {max_value}"
-                )
-            
-            logger.debug(f"NumberInputBlock {self.node_id} returning value: {numeric_value}")
+            logger.debug("NumberInputBlock %s returning value: %s", self.node_id, numeric_value)
             
             return BlockResult(
                 success=True,
@@ -170,13 +219,15 @@ class NumberInputBlock(BaseBlock):
                 metadata={
                     "type": type(numeric_value).__name__,
                     "original_value": raw_value
-                }
+                } if COLLECT_METADATA else None
             )
             
         except Exception as e:
-            logger.error(f"Error in NumberInputBlock {self.node_id}: {str(e)}", exc_info=True)
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {str(e)}"
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in NumberInputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
+            return _err(f"Unexpected error: {str(e)}")
@@ -6,13 +6,91 @@ These blocks accept inputs from upstream nodes and format them for display.
 """
 
 import logging
-from typing import Dict, Any
+import math
+from typing import Callable, Dict, Any, Optional
 import json
 
-from app.blocks.base import BaseBlock, BlockResult
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speedup
+    orjson = None
+
+from pydantic import BaseModel, ValidationError
+
+from app.blocks.base import COLLECT_METADATA, BaseBlock, BlockResult
 
 logger = logging.getLogger(__name__)
 
+# Positive infinity, used to tell +inf from -inf once a float is non-finite.
+_INF = math.inf
+
+# "[type] " prefixes for the "pretty" text format, built once per value type.
+# Module-level rather than per block, since blocks are created per execution.
+_PRETTY_PREFIXES: Dict[type, str] = {}
+
+
+def _dumps_indented(value: Any) -> str:
+    """Serialise *value* as 2-space indented JSON.
+
+    Uses orjson when it is installed and ``json.dumps(value, indent=2)``
+    otherwise. The two layouts match for plain ASCII data, but orjson
+    writes non-ASCII characters unescaped, NaN and infinities as ``null``,
+    ``1e16`` where the stdlib writes ``1e+16``, and encodes datetimes and
+    UUIDs itself. Values orjson rejects but the stdlib accepts (ints wider
+    than 64 bits) are encoded entirely by the stdlib. Unserialisable values
+    raise ``TypeError``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, indent=2)
+
+
+def _format_plain(value: Any, node_id: str) -> str:
+    """Format *value* for the "plain" text format."""
+    return str(value)
+
+
+def _format_json(value: Any, node_id: str) -> str:
+    """Format *value* for the "json" text format, falling back to ``str``."""
+    try:
+        # Try to format as JSON
+        if isinstance(value, (dict, list)):
+            return _dumps_indented(value)
+        return _dumps_indented({"value": value})
+    except (TypeError, ValueError):
+        # Fall back to string conversion
+        logger.warning("TextOutputBlock %s failed to format JSON: %s", node_id, value)
+        return str(value)
+
+
+def _format_pretty(value: Any, node_id: str) -> str:
+    """Format *value* for the "pretty" text format (type-prefixed)."""
+    # Pretty print with type information
+    value_type = type(value)
+    prefix = _PRETTY_PREFIXES.get(value_type)
+    if prefix is None:
+        prefix = _PRETTY_PREFIXES[value_type] = f"[{value_type.__name__}] "
+    return prefix + str(value)
+
+
+# TextOutputBlock formatters by ``format`` config value, selected once per
+# config so run() makes one indirect call instead of comparing strings.
+_TEXT_FORMATTERS: Dict[str, Callable[[Any, str], str]] = {
+    "plain": _format_plain,
+    "json": _format_json,
+    "pretty": _format_pretty,
+}
+
+
+def _err(message: str) -> BlockResult:
+    """Build a failed ``BlockResult`` carrying *message* as its error."""
+    return BlockResult(success=False, value=None, error=message)
+
 
 class TextOutputBlock(BaseBlock):
     """
@@ -25,7 +103,25 @@ class TextOutputBlock(BaseBlock):
     Returns:
         BlockResult with the formatted text output
     """
-    
+
+    # Any value, a failed upstream's None included, has a text form
+    requires_all_inputs = False
+
+    def _set_config(
+        self, cfg: Optional[BaseModel], error: Optional[ValidationError]
+    ) -> None:
+        """Read the display options and select the formatter once."""
+        super()._set_config(cfg, error)
+        self._output_format = self.config.get("format", "plain")
+        self._max_length = self.config.get("max_display_length")
+        # Unknown (or non-string) formats fall back to plain text
+        output_format = self._output_format
+        self._format_fn = (
+            _TEXT_FORMATTERS.get(output_format, _format_plain)
+            if isinstance(output_format, str)
+            else _format_plain
+        )
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """
         Execute the text output block.
@@ -39,40 +135,24 @@ class TextOutputBlock(BaseBlock):
         try:
             # If no inputs, return empty string
             if not inputs:
-                logger.warning(f"TextOutputBlock {self.node_id} received no inputs")
+                logger.warning("TextOutputBlock %s received no inputs", self.node_id)
                 return BlockResult(
                     success=True,
                     value="",
-                    metadata={"input_count": 0}
+                    metadata={"input_count": 0} if COLLECT_METADATA else None
                 )
             
             # Get the first input value (output nodes typically have one input)
-            input_value = list(inputs.values())[0]
-            
-            # Get formatting configuration
-            output_format = self.config.get("format", "plain")
-            max_length = self.config.get("max_display_length")
+            input_value = next(iter(inputs.values()))
             
-            # Format the output based on configuration
-            if output_format == "json":
-                try:
-                    # Try to format as JSON
-                    if isinstance(input_value, (dict, list)):
-                        formatted_text = json.dumps(input_value, indent=2)
-                    else:
-                        formatted_text = json.dumps({"value": input_value}, indent=2)
-                except (TypeError, ValueError):
-                    # Fall back to string conversion
-                    logger.warning(f"TextOutputBlock {self.node_id} failed to format JSON: {str(input_value)}")
-                    formatted_text = str(input_value)
-            
-            elif output_format == "pretty":
-                # Pretty print with type information
-                value_type = type(input_value).__name__
-                formatted_text = f"[{value_type}] {input_value}"
-            
-            else:  # plain
-                formatted_text = str(input_value)
+            # Formatting options are cached per config object
+            if self.config is not self._cfg_source:
+                self._load_config()
+            output_format = self._output_format
+            max_length = self._max_length
+
+            # Format the output with the formatter selected for this config
+            formatted_text = self._format_fn(input_value, self.node_id)
             
             # Apply max length constraint if configured
             if max_length is not None and len(formatted_text) > max_length:
@@ -81,7 +161,7 @@ class TextOutputBlock(BaseBlock):
             else:
                 truncated = False
             
-            logger.debug(f"TextOutputBlock {self.node_id} formatted output: {formatted_text[:100]}...")
+            logger.debug("TextOutputBlock %s formatted output: %.100s...", self.node_id, formatted_text)
             
             return BlockResult(
                 success=True,
@@ -91,16 +171,18 @@ class TextOutputBlock(BaseBlock):
                     "length": len(formatted_text),
                     "truncated": truncated,
                     "input_type": type(input_value).__name__
-                }
+                } if COLLECT_METADATA else None
             )
             
         except Exception as e:
-            logger.error(f"Error in TextOutputBlock {self.node_id}: {str(e)}", exc_info=True)
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {str(e)}"
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in TextOutputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
+            return _err(f"Unexpected error: {str(e)}")
 
 
 class NumberOutputBlock(BaseBlock):
@@ -116,7 +198,24 @@ class NumberOutputBlock(BaseBlock):
     Returns:
         BlockResult with the formatted numeric output
     """
-    
+
+    def _set_config(
+        self, cfg: Optional[BaseModel], error: Optional[ValidationError]
+    ) -> None:
+        """Read the formatting options and build their format specs once."""
+        super()._set_config(cfg, error)
+        decimal_places = self.config.get("decimal_places")
+        self._use_scientific = self.config.get("scientific_notation", False)
+        self._sci_threshold = self.config.get("scientific_threshold", 1e6)
+        # The "," option makes format() insert thousands separators itself.
+        # Scientific notation never gets them.
+        sep = "," if self.config.get("use_thousands_separator", True) else ""
+        self._sci_spec = f".{decimal_places or 2}e"
+        self._float_spec = (
+            f"{sep}.{decimal_places}f" if decimal_places is not None else sep
+        )
+        self._int_spec = f"{sep}d" if sep else ""
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """
         Execute the number output block.
@@ -130,14 +229,10 @@ class NumberOutputBlock(BaseBlock):
         try:
             # If no inputs, return error
             if not inputs:
-                return BlockResult(
-                    success=False,
-                    value=None,
-                    error="No input provided to number output block"
-                )
+                return _err("No input provided to number output block")
             
             # Get the first input value
-            input_value = list(inputs.values())[0]
+            input_value = next(iter(inputs.values()))
             
             # Validate that it's a number
             if not isinstance(input_value, (int, float)):
@@ -146,63 +241,45 @@ class NumberOutputBlock(BaseBlock):
                     if isinstance(input_value, str):
                         input_value = float(input_value) if '.' in input_value else int(input_value)
                     else:
-                        return BlockResult(
-                            success=False,
-                            value=None,
-                            error=f"Expected numeric input, got {type(input_value).__name__}"
-                        )
+                        return _err(f"Expected numeric input, got {type(input_value).__name__}")
                 except (ValueError, TypeError):
-                    return BlockResult(
-                        success=False,
-                        value=None,
-                        error=f"Cannot convert '{input_value}' to number"
-                    )
+                    return _err(f"Cannot convert '{input_value}' to number")
             
             # Check for special values
             is_special = False
             special_type = None
             formatted_value = str(input_value)  # Default formatting
             
-            if isinstance(input_value, float):
-                if input_value != input_value:  # NaN check
-                    is_special = True
+            # One isfinite() call clears ordinary floats; only NaN/±inf
+            # go on to be told apart.
+            if isinstance(input_value, float) and not math.isfinite(input_value):
+                is_special = True
+                if math.isnan(input_value):
                     special_type = "NaN"
                     formatted_value = "NaN"
-                elif input_value == float('inf'):
-                    is_special = True
+                elif input_value == _INF:
                     special_type = "Infinity"
                     formatted_value = "∞"
-                elif input_value == float('-inf'):
-                    is_special = True
+                else:
                     special_type = "-Infinity"
                     formatted_value = "-∞"
             
             # Format the number if not special
             if not is_special:
-                # Get formatting configuration
-                decimal_places = self.config.get("decimal_places")
-                use_thousands_sep = self.config.get("use_thousands_separator", True)
-                use_scientific = self.config.get("scientific_notation", False)
-                sci_threshold = self.config.get("scientific_threshold", 1e6)
+                # Formatting options and specs are cached per config object
+                if self.config is not self._cfg_source:
+                    self._load_config()
+                use_scientific = self._use_scientific
                 
                 # Determine if we should use scientific notation
-                if use_scientific or (abs(input_value) >= sci_threshold and isinstance(input_value, float)):
-                    formatted_value = f"{input_value:.{decimal_places or 2}e}"
+                if use_scientific or (abs(input_value) >= self._sci_threshold and isinstance(input_value, float)):
+                    formatted_value = format(input_value, self._sci_spec)
                 elif isinstance(input_value, float):
-                    if decimal_places is not None:
-                        formatted_value = f"{input_value:.{decimal_places}f}"
-                    else:
-                        formatted_value = str(input_value)
+                    formatted_value = format(input_value, self._float_spec)
                 else:  # int
-                    formatted_value = str(input_value)
-                
-                # Add thousands separator if requested
-                if use_thousands_sep and not use_scientific:
-                    parts = formatted_value.split('.')
-                    parts[0] = f"{int(parts[0]):,}"
-                    formatted_value = '.'.join(parts)
+                    formatted_value = format(input_value, self._int_spec)
             
-            logger.debug(f"NumberOutputBlock {self.node_id} formatted output: {formatted_value}")
+            logger.debug("NumberOutputBlock %s formatted output: %s", self.node_id, formatted_value)
             
             return BlockResult(
                 success=True,
@@ -212,13 +289,15 @@ class NumberOutputBlock(BaseBlock):
                     "type": type(input_value).__name__,
                     "is_special": is_special,
                     "special_type": special_type
-                }
+                } if COLLECT_METADATA else None
             )
             
         except Exception as e:
-            logger.error(f"Error in NumberOutputBlock {self.node_id}: {str(e)}", exc_info=True)
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {str(e)}"
+            # Tracebacks only at DEBUG; the message already names the error
+            logger.error(
+                "Error in NumberOutputBlock %s: %s",
+                self.node_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
+            return _err(f"Unexpected error: {str(e)}")
@@ -7,11 +7,12 @@ These blocks accept two numeric inputs and produce a single numeric result.
 """
 
 import logging
-from typing import Dict, Any, Union
+import operator
+from typing import Callable, Dict, Any, Optional, Sequence, Union
 
 from pydantic import ValidationError
 
-from app.blocks.base import BaseBlock, BlockResult
+from app.blocks.base import COLLECT_METADATA, BaseBlock, BlockResult
 from app.schemas import MathBlockConfig
 
 logger = logging.getLogger(__name__)
@@ -27,14 +28,44 @@ _OPERATION_LABELS: Dict[str, str] = {
     "divide": "division",
 }
 
+# Maps operation names to their arithmetic implementation. Division by zero is
+# left to ``operator.truediv``, which raises ``ZeroDivisionError`` natively.
+_OP_TABLE: Dict[str, Callable[[Numeric, Numeric], Numeric]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+_DIVISION_BY_ZERO_MSG = "Division by zero is undefined."
+
+# Values reported as ``metadata["result_type"]``.
+_INT_NAME = "int"
+_FLOAT_NAME = "float"
+
+
+def _divide_preserving_int(a: Numeric, b: Numeric) -> Numeric:
+    """Divide like ``MathOperationBlock.run``: whole int/int quotients stay ``int``."""
+    result = a / b
+    if type(a) is int and type(b) is int and result.is_integer():
+        return int(result)
+    return result
+
+
+def _err(message: str) -> BlockResult:
+    """Build a failed ``BlockResult`` carrying *message* as its error."""
+    return BlockResult(success=False, value=None, error=message)
+
 
 class MathOperationBlock(BaseBlock):
     """
     Math Operation Block — performs basic arithmetic on two numeric inputs.
 
-    Configuration is parsed and validated by ``MathBlockConfig`` at the start of
-    every ``run()`` call. Pydantic enforces that ``operation`` is one of the four
-    supported values.
+    Configuration is parsed and validated by ``MathBlockConfig`` once, when the
+    block is constructed, and the parsed model is cached on the instance.
+    Pydantic enforces that ``operation`` is one of the four supported values.
+    If ``self.config`` is replaced after construction, the new dict is
+    validated on the next ``run()`` call.
 
     Expected inputs (keyed by target handle name):
         - ``"a"`` (int | float): The left-hand operand.
@@ -47,10 +78,50 @@ class MathOperationBlock(BaseBlock):
     Errors wrapped in BlockResult (success=False):
         - ``ValidationError``: operation string is not one of the four allowed values.
         - ``ZeroDivisionError``: divisor is zero.
-        - ``TypeError``: an operand is not numeric (int or float).
+        - ``TypeError``: an operand is not numeric (int or float). ``bool``
+          operands are rejected even though ``bool`` subclasses ``int``.
         - ``KeyError``: a required input key (``"a"`` or ``"b"``) is missing.
     """
 
+    config_model = MathBlockConfig
+
+    def _set_config(
+        self, cfg: Optional[MathBlockConfig], error: Optional[ValidationError]
+    ) -> None:
+        """Cache the config and the operation/kernel it selects."""
+        super()._set_config(cfg, error)
+        self._op = cfg.operation if cfg is not None else None
+        # Resolve the arithmetic kernel once so run() skips the table lookup.
+        self._kernel = _OP_TABLE[cfg.operation] if cfg is not None else None
+
+    @property
+    def operation(self) -> Optional[str]:
+        """The configured operation name, or ``None`` if the config is invalid."""
+        if self.config is not self._cfg_source:
+            self._load_config()
+        return self._op
+
+    def kernel(self) -> Callable[[Numeric, Numeric], Numeric]:
+        """
+        Return the configured operation as a plain two-operand function.
+
+        The function computes what a successful ``run()`` would return as its
+        value, including the whole-number-to-``int`` rule for division, but
+        raises instead of wrapping errors and does not type-check operands.
+
+        Raises:
+            ValueError: If the block's configuration is invalid.
+        """
+        if self.config is not self._cfg_source:
+            self._load_config()
+        if self._cfg_error is not None:
+            raise ValueError(
+                f"MathOperationBlock '{self.node_id}' has an invalid configuration."
+            )
+        if self._op == "divide":
+            return _divide_preserving_int
+        return self._kernel
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """
         Execute the math operation block.
@@ -64,109 +135,97 @@ class MathOperationBlock(BaseBlock):
             descriptive error message on failure.
         """
         try:
-            # ── 1. Parse & validate configuration via Pydantic ───────────────
-            # ValidationError is raised automatically if ``operation`` is not a
-            # valid MathOperation Literal value — no manual checking required.
-            cfg = MathBlockConfig.model_validate(self.config)
+            # ── 1. Resolve the cached configuration ─────────────────────────
+            # Validation ran in ``__init__``; only re-validate if the config
+            # dict has been swapped out since then.
+            if self.config is not self._cfg_source:
+                self._load_config()
+            if self._cfg_error is not None:
+                return self._invalid_config_result(self._cfg_error)
+            operation = self._op
 
             # ── 2. Extract operands ──────────────────────────────────────────
+            # One try block covers both lookups; the missing key is recovered
+            # from the KeyError itself.
             try:
                 a = inputs["a"]
-            except KeyError:
-                raise KeyError("Required input 'a' is missing from inputs.")
-
-            try:
                 b = inputs["b"]
-            except KeyError:
-                raise KeyError("Required input 'b' is missing from inputs.")
+            except KeyError as exc:
+                raise KeyError(
+                    f"Required input '{exc.args[0]}' is missing from inputs."
+                ) from None
 
             # ── 3. Type validation ───────────────────────────────────────────
-            if not isinstance(a, (int, float)):
+            # Operand types are looked up once and reused for the error
+            # messages and the type-preservation rule below. Exact-type checks
+            # reject ``bool`` (an ``int`` subclass) instead of treating
+            # True/False as 1/0.
+            ta = type(a)
+            tb = type(b)
+            if ta is not int and ta is not float:
                 raise TypeError(
                     f"Input 'a' must be numeric (int or float), "
-                    f"got {type(a).__name__}."
+                    f"got {ta.__name__}."
                 )
-            if not isinstance(b, (int, float)):
+            if tb is not int and tb is not float:
                 raise TypeError(
                     f"Input 'b' must be numeric (int or float), "
-                    f"got {type(b).__name__}."
+                    f"got {tb.__name__}."
                 )
 
             # ── 4. Perform operation ─────────────────────────────────────────
-            if cfg.operation == "add":
-                raw_result: Numeric = a + b
-            elif cfg.operation == "subtract":
-                raw_result = a - b
-            elif cfg.operation == "multiply":
-                raw_result = a * b
-            else:  # "divide" — the only remaining Literal value
-                if b == 0:
-                    raise ZeroDivisionError("Division by zero is undefined.")
-                raw_result = a / b
+            raw_result: Numeric = self._kernel(a, b)
 
             # ── 5. Integer type preservation ─────────────────────────────────
             # Return int when both operands were integers and the division
             # produced a whole-number float (e.g. 10 / 2 → 5, not 5.0).
-            if (
-                isinstance(raw_result, float)
-                and raw_result.is_integer()
-                and isinstance(a, int)
-                and isinstance(b, int)
-            ):
+            both_int = ta is int and tb is int
+            if both_int and type(raw_result) is float and raw_result.is_integer():
                 result_value: Numeric = int(raw_result)
             else:
                 result_value = raw_result
+            # Operands are exactly int or float, so the result is one of the
+            # two as well and its name can come from a constant.
+            result_type_name = _INT_NAME if type(result_value) is int else _FLOAT_NAME
 
             logger.info(
                 "MathOperationBlock '%s' completed %s: result_type=%s",
                 self.node_id,
-                _OPERATION_LABELS[cfg.operation],
-                type(result_value).__name__,
+                _OPERATION_LABELS[operation],
+                result_type_name,
             )
 
             return BlockResult(
                 success=True,
                 value=result_value,
                 metadata={
-                    "operation": cfg.operation,
-                    "result_type": type(result_value).__name__,
-                },
-            )
-
-        except ValidationError as exc:
-            # Pydantic reports the invalid operation value in its error details.
-            # We surface only the human-readable message — no raw config leaked.
-            logger.error(
-                "MathOperationBlock '%s' invalid configuration: %s",
-                self.node_id,
-                exc.error_count(),
+                    "operation": operation,
+                    "result_type": result_type_name,
+                } if COLLECT_METADATA else None,
             )
-            # Extract the first error's message for a concise BlockResult error.
-            first_msg = exc.errors()[0].get("msg", "Invalid configuration.")
-            return BlockResult(success=False, value=None, error=first_msg)
 
-        except ZeroDivisionError as exc:
+        except ZeroDivisionError:
             logger.error(
                 "MathOperationBlock '%s' division by zero error.",
                 self.node_id,
             )
-            return BlockResult(success=False, value=None, error=str(exc))
+            return _err(_DIVISION_BY_ZERO_MSG)
 
         except TypeError as exc:
             logger.error(
                 "MathOperationBlock '%s' type error: %s",
                 self.node_id,
-                str(exc),
+                exc,
             )
-            return BlockResult(success=False, value=None, error=str(exc))
+            return _err(exc.args[0] if exc.args else type(exc).__name__)
 
         except KeyError as exc:
             logger.error(
                 "MathOperationBlock '%s' missing input key: %s",
                 self.node_id,
-                str(exc),
+                exc,
             )
-            return BlockResult(success=False, value=None, error=str(exc))
+            return _err(exc.args[0] if exc.args else type(exc).__name__)
 
         except Exception as exc:
             logger.error(
@@ -174,8 +233,145 @@ class MathOperationBlock(BaseBlock):
                 self.node_id,
                 exc_info=True,
             )
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {type(exc).__name__}",
+            return _err(f"Unexpected error: {type(exc).__name__}")
+
+    def run_batch(self, a: Sequence[Numeric], b: Sequence[Numeric]) -> BlockResult:
+        """
+        Apply the configured operation element-wise over two operand batches.
+
+        Intended for flows evaluated over many input records at once. NumPy
+        arrays are passed to the kernel whole, so ``operator.add`` & co.
+        dispatch to the matching ufunc (``np.add``, ...) in a single call and
+        the result is an array. Any other sequences are mapped pair by pair
+        and the result is a list.
+
+        Sequence batches follow ``run()`` element by element: each operand
+        must be exactly ``int`` or ``float`` (``bool`` is rejected), and
+        whole int/int quotients stay ``int``. NumPy arrays follow NumPy's own
+        dtype rules instead, including for division by zero (``inf``/``nan``
+        plus a ``RuntimeWarning``) rather than failing.
+
+        Args:
+            a: Left-hand operands.
+            b: Right-hand operands; must have the same length as ``a``.
+
+        Returns:
+            BlockResult whose ``value`` holds one result per operand pair.
+        """
+        if self.config is not self._cfg_source:
+            self._load_config()
+        if self._cfg_error is not None:
+            return self._invalid_config_result(self._cfg_error)
+
+        try:
+            size = len(a)
+            if size != len(b):
+                return _err(
+                    f"Batch operands differ in length: {size} != {len(b)}."
+                )
+
+            if hasattr(a, "__array_ufunc__") or hasattr(b, "__array_ufunc__"):
+                values = self._kernel(a, b)
+            else:
+                kernel = self._kernel
+                values = []
+                append = values.append
+                for index, (x, y) in enumerate(zip(a, b)):
+                    tx = type(x)
+                    ty = type(y)
+                    if tx is not int and tx is not float:
+                        raise TypeError(
+                            f"Batch operand 'a[{index}]' must be numeric "
+                            f"(int or float), got {tx.__name__}."
+                        )
+                    if ty is not int and ty is not float:
+                        raise TypeError(
+                            f"Batch operand 'b[{index}]' must be numeric "
+                            f"(int or float), got {ty.__name__}."
+                        )
+                    value = kernel(x, y)
+                    # Same int preservation as run() (e.g. 10 / 2 → 5)
+                    if tx is int and ty is int and type(value) is float and value.is_integer():
+                        value = int(value)
+                    append(value)
+        except ZeroDivisionError:
+            logger.error(
+                "MathOperationBlock '%s' division by zero error in batch.",
+                self.node_id,
+            )
+            return _err(_DIVISION_BY_ZERO_MSG)
+        except TypeError as exc:
+            logger.error(
+                "MathOperationBlock '%s' batch type error: %s",
+                self.node_id,
+                exc,
+            )
+            return _err(exc.args[0] if exc.args else type(exc).__name__)
+        except Exception as exc:
+            logger.error(
+                "MathOperationBlock '%s' unexpected error in batch.",
+                self.node_id,
+                exc_info=True,
             )
+            return _err(f"Unexpected error: {type(exc).__name__}")
+
+        return BlockResult(
+            success=True,
+            value=values,
+            metadata=(
+                {"operation": self._op, "batch_size": size}
+                if COLLECT_METADATA
+                else None
+            ),
+        )
+
+
+def fuse_chain(blocks: Sequence[MathOperationBlock]) -> Callable[..., Numeric]:
+    """Compose a chain of math blocks into a single Python function.
+
+    The chain is left-deep: the first block combines operands ``x0`` and
+    ``x1``, and every following block combines the previous result (as its
+    ``"a"`` input) with the next operand. The blocks' kernels are bound
+    once, so a call folds the operands through them without building
+    intermediate ``BlockResult`` objects or re-checking configuration.
+
+    Results match running the blocks one after another: operands are
+    type-checked up front (``bool`` is rejected), and division keeps the
+    same whole-number-to-``int`` rule. Errors are raised rather than
+    wrapped — ``TypeError`` for a non-numeric operand or a wrong operand
+    count, and ``ZeroDivisionError`` for a zero divisor.
+
+    Args:
+        blocks: The chain, in execution order. Must be non-empty and every
+            block must have a valid configuration.
+
+    Returns:
+        A function taking ``len(blocks) + 1`` numeric operands, named after
+        the chain's operations (e.g. ``fused_add_divide``).
+
+    Raises:
+        ValueError: If the chain is empty or a block's config is invalid.
+    """
+    if not blocks:
+        raise ValueError("Cannot fuse an empty chain of math blocks.")
+
+    kernels = tuple(block.kernel() for block in blocks)
+    arity = len(kernels) + 1
+    name = "fused_" + "_".join(block.operation for block in blocks)
+
+    def fused(*operands: Numeric) -> Numeric:
+        if len(operands) != arity:
+            raise TypeError(f"{name}() takes {arity} operands, got {len(operands)}.")
+        for index, operand in enumerate(operands):
+            t = type(operand)
+            if t is not int and t is not float:
+                raise TypeError(
+                    f"Operand {index} must be numeric (int or float), got {t.__name__}."
+                )
+        value = operands[0]
+        for kernel, operand in zip(kernels, operands[1:]):
+            value = kernel(value, operand)
+        return value
+
+    fused.__name__ = fused.__qualname__ = name
+    return fused
@@ -8,35 +8,36 @@ separator, coercing non-string values to strings before joining.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import ValidationError
 
-from app.blocks.base import BaseBlock, BlockResult
+from app.blocks.base import COLLECT_METADATA, BaseBlock, BlockResult
 from app.schemas import TextJoinConfig
 
 logger = logging.getLogger(__name__)
 
-# Escape-sequence map: the frontend stores literal backslash-n / backslash-t
-# so the input box is not invisible and the user can read what they typed.
-# We translate these to real control characters before joining.
-_ESCAPE_MAP: Dict[str, str] = {
-    "\\n": "\n",
-    "\\t": "\t",
-    "\\r": "\r",
-}
+# Required handles, in join order. Any other handle is appended after these in
+# lexicographic order.
+_PRIMARY_HANDLES = ("a", "b")
+_PRIMARY_HANDLE_SET = frozenset(_PRIMARY_HANDLES)
 
 
 def _resolve_separator(raw: str) -> str:
     """Translate literal escape sequences to real control characters.
 
+    The frontend stores literal backslash-n / backslash-t so the input box is
+    not invisible and the user can read what they typed. We translate these
+    to real control characters before joining. Escapes are replaced wherever
+    they occur, so multi-character separators such as ``",\\n"`` work too.
+
     Args:
         raw: Separator string as stored in config (e.g. ``"\\n"``).
 
     Returns:
         Separator with escape sequences replaced (e.g. ``"\n"``).
     """
-    return _ESCAPE_MAP.get(raw, raw)
+    return raw.replace("\\n", "\n").replace("\\t", "\t").replace("\\r", "\r")
 
 
 def _coerce_input(value: Any, handle_id: str, node_id: str) -> str:
@@ -50,9 +51,10 @@ def _coerce_input(value: Any, handle_id: str, node_id: str) -> str:
     Returns:
         String representation of *value*. ``None`` is mapped to ``""``.
 
-    Raises:
-        TypeError: If the value cannot be coerced to a string (e.g. a
-            custom object whose ``__str__`` raises).
+    A failing ``__str__`` propagates unchanged. ``TextJoinBlock.run``
+    reports a ``TypeError`` (which ``str()`` also raises when ``__str__``
+    returns a non-string) with its message, and any other exception as
+    ``"Unexpected error: <type>"``.
     """
     if value is None:
         logger.debug(
@@ -62,23 +64,23 @@ def _coerce_input(value: Any, handle_id: str, node_id: str) -> str:
         )
         return ""
 
-    if isinstance(value, str):
+    # Exact type check: skips the subclass walk of isinstance() on the
+    # common path; str subclasses simply go through str() below.
+    if type(value) is str:
         return value
 
-    try:
-        coerced = str(value)
-        logger.debug(
-            "TextJoinBlock '%s' handle '%s': %s coerced to str.",
-            node_id,
-            handle_id,
-            type(value).__name__,
-        )
-        return coerced
-    except Exception as exc:  # pragma: no cover — defensive guard
-        raise TypeError(
-            f"Input on handle '{handle_id}' of type {type(value).__name__} "
-            f"cannot be converted to string."
-        ) from exc
+    logger.debug(
+        "TextJoinBlock '%s' handle '%s': %s coerced to str.",
+        node_id,
+        handle_id,
+        type(value).__name__,
+    )
+    return str(value)
+
+
+def _err(message: str) -> BlockResult:
+    """Build a failed ``BlockResult`` carrying *message* as its error."""
+    return BlockResult(success=False, value=None, error=message)
 
 
 class TextJoinBlock(BaseBlock):
@@ -92,8 +94,10 @@ class TextJoinBlock(BaseBlock):
     Non-string inputs are coerced to ``str`` (logged at DEBUG level).
     ``None`` values are treated as empty strings (logged at DEBUG level).
 
-    Configuration is validated by ``TextJoinConfig`` via Pydantic at the start
-    of every ``run()`` call, so invalid config is caught immediately.
+    Configuration is validated by ``TextJoinConfig`` via Pydantic once, when the
+    block is constructed, and the parsed model is cached on the instance. If
+    ``self.config`` is replaced after construction, the new dict is validated
+    on the next ``run()`` call.
 
     Args (via ``inputs`` dict, keyed by target handle ID):
         ``"a"`` (Any): First text input (required).
@@ -107,9 +111,29 @@ class TextJoinBlock(BaseBlock):
     Errors wrapped in ``BlockResult`` (``success=False``):
         - ``ValidationError``: config is structurally invalid.
         - ``KeyError``: a required handle key (``"a"`` or ``"b"``) is missing.
-        - ``TypeError``: an input cannot be coerced to string.
+        - ``TypeError``: an input's ``__str__`` raises ``TypeError`` or returns
+          a non-string. Other exceptions from ``__str__`` are reported as
+          ``"Unexpected error: <type>"``.
     """
 
+    config_model = TextJoinConfig
+    # A failed upstream arrives as None and joins as an empty string
+    requires_all_inputs = False
+
+    def _set_config(
+        self, cfg: Optional[TextJoinConfig], error: Optional[ValidationError]
+    ) -> None:
+        """Cache the config, the resolved separator and a metadata template."""
+        super()._set_config(cfg, error)
+        self._separator = _resolve_separator(cfg.separator) if cfg is not None else None
+        # Copying a dict that already holds the keys (and the invariant raw
+        # separator) is cheaper than building a new literal on every run.
+        self._metadata_template = {
+            "input_count": 0,
+            "separator": cfg.separator if cfg is not None else None,
+            "output_length": 0,
+        }
+
     def run(self, inputs: Dict[str, Any]) -> BlockResult:
         """Execute the text join block.
 
@@ -122,72 +146,104 @@ class TextJoinBlock(BaseBlock):
             descriptive error message on failure.
         """
         try:
-            # ── 1. Parse & validate configuration via Pydantic ───────────────
-            cfg = TextJoinConfig.model_validate(self.config)
-            separator = _resolve_separator(cfg.separator)
-
-            # ── 2. Extract and coerce inputs ─────────────────────────────────
-            # Require at least the two primary handles "a" and "b".
-            for required_handle in ("a", "b"):
-                if required_handle not in inputs:
-                    raise KeyError(
-                        f"Required input '{required_handle}' is missing from inputs."
-                    )
-
-            # Build an ordered list: "a", "b", then any extra handles sorted.
-            primary_handles = ["a", "b"]
-            extra_handles = sorted(k for k in inputs if k not in primary_handles)
-            ordered_handles = primary_handles + extra_handles
-
-            parts: List[str] = []
-            for handle_id in ordered_handles:
-                parts.append(_coerce_input(inputs[handle_id], handle_id, self.node_id))
-
-            # ── 3. Join ──────────────────────────────────────────────────────
-            result_value: str = separator.join(parts)
+            # ── 1. Resolve the cached configuration ─────────────────────────
+            # Validation ran in ``__init__``; only re-validate if the config
+            # dict has been swapped out since then.
+            if self.config is not self._cfg_source:
+                self._load_config()
+            if self._cfg_error is not None:
+                return self._invalid_config_result(self._cfg_error)
+            cfg = self._cfg
+            separator = self._separator
+
+            # ── 2. Extract, coerce and join inputs ───────────────────────────
+            # Require at least the two primary handles "a" and "b". One try
+            # block fetches both; the missing key is recovered from the
+            # KeyError itself, so the success path does no membership tests.
+            try:
+                a = inputs["a"]
+                b = inputs["b"]
+            except KeyError as exc:
+                raise KeyError(
+                    f"Required input '{exc.args[0]}' is missing from inputs."
+                ) from None
+
+            # Build an ordered tuple: "a", "b", then any extra handles sorted.
+            # With both primaries present, exactly two keys means no extras —
+            # the common case skips the set difference and the sort.
+            if len(inputs) == 2:
+                ordered_handles = _PRIMARY_HANDLES
+            else:
+                ordered_handles = _PRIMARY_HANDLES + tuple(
+                    sorted(inputs.keys() - _PRIMARY_HANDLE_SET)
+                )
+
+            # The per-value debug trace needs ``_coerce_input``; otherwise the
+            # same two-branch coercion is inlined to skip a call per input.
+            if logger.isEnabledFor(logging.DEBUG):
+                node_id = self.node_id
+                parts: List[str] = [
+                    _coerce_input(inputs[handle_id], handle_id, node_id)
+                    for handle_id in ordered_handles
+                ]
+                part_count = len(parts)
+                result_value: str = separator.join(parts)
+            elif ordered_handles is _PRIMARY_HANDLES:
+                # Two inputs: concatenate directly instead of building a list
+                # for str.join. Once coerced both parts are exact str, so the
+                # f-string (one pre-sized BUILD_STRING) is a plain concat.
+                if type(a) is not str:
+                    a = "" if a is None else str(a)
+                if type(b) is not str:
+                    b = "" if b is None else str(b)
+                part_count = 2
+                result_value = f"{a}{separator}{b}"
+            else:
+                parts = []
+                parts_append = parts.append
+                for handle_id in ordered_handles:
+                    value = inputs[handle_id]
+                    if value is None:
+                        parts_append("")
+                    elif type(value) is str:
+                        parts_append(value)
+                    else:
+                        parts_append(str(value))
+                part_count = len(parts)
+                result_value = separator.join(parts)
 
             logger.info(
                 "TextJoinBlock '%s' joined %d input(s); separator=%r; "
                 "output_length=%d chars.",
                 self.node_id,
-                len(parts),
+                part_count,
                 cfg.separator,  # log the raw config value, not the resolved one
                 len(result_value),
             )
 
-            return BlockResult(
-                success=True,
-                value=result_value,
-                metadata={
-                    "input_count": len(parts),
-                    "separator": cfg.separator,
-                    "output_length": len(result_value),
-                },
-            )
+            metadata = None
+            if COLLECT_METADATA:
+                metadata = self._metadata_template.copy()
+                metadata["input_count"] = part_count
+                metadata["output_length"] = len(result_value)
 
-        except ValidationError as exc:
-            logger.error(
-                "TextJoinBlock '%s' invalid configuration: %d error(s).",
-                self.node_id,
-                exc.error_count(),
-            )
-            first_msg = exc.errors()[0].get("msg", "Invalid configuration.")
-            return BlockResult(success=False, value=None, error=first_msg)
+            return BlockResult(success=True, value=result_value, metadata=metadata)
 
         except KeyError as exc:
             logger.error(
                 "TextJoinBlock '%s' missing input key: %s",
                 self.node_id,
-                str(exc),
+                exc,
             )
-            return BlockResult(success=False, value=None, error=str(exc))
+            return _err(exc.args[0] if exc.args else type(exc).__name__)
 
         except TypeError as exc:
             logger.error(
-                "TextJoinBlock '%s' type coercion error.",
+                "TextJoinBlock '%s' type error while coercing inputs: %s",
                 self.node_id,
+                exc,
             )
-            return BlockResult(success=False, value=None, error=str(exc))
+            return _err(exc.args[0] if exc.args else type(exc).__name__)
 
         except Exception as exc:
             logger.error(
@@ -195,8 +251,4 @@ class TextJoinBlock(BaseBlock):
                 self.node_id,
                 exc_info=True,
             )
-            return BlockResult(
-                success=False,
-                value=None,
-                error=f"Unexpected error: {type(exc).__name__}",
-            )
+            return _err(f"Unexpected error: {type(exc).__name__}")
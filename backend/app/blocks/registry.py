@@ -0,0 +1,26 @@
+"""
+Block Registry
+
+Maps node ``type`` strings from the flow editor to the block classes that
+execute them. Built once at import time and exposed read-only.
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Type
+
+from app.blocks.base import BaseBlock
+from app.blocks.io.input_blocks import TextInputBlock, NumberInputBlock
+from app.blocks.io.output_blocks import TextOutputBlock, NumberOutputBlock
+from app.blocks.logic.math_blocks import MathOperationBlock
+from app.blocks.logic.text_blocks import TextJoinBlock
+
+BLOCK_REGISTRY: Mapping[str, Type[BaseBlock]] = MappingProxyType({
+    "text_input": TextInputBlock,
+    "number_input": NumberInputBlock,
+    "text_output": TextOutputBlock,
+    "number_output": NumberOutputBlock,
+    "math_operation": MathOperationBlock,
+    "text_join": TextJoinBlock,
+})
+
+__all__ = ["BLOCK_REGISTRY"]
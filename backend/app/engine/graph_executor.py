@@ -7,15 +7,93 @@ in the correct order based on their dependencies.
 """
 
 import logging
-from typing import Dict, List, Any, Set, Deque
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Hashable, Mapping, NamedTuple, Optional, Set, Deque, Tuple, Union
 from collections import deque, defaultdict
 
 from app.schemas import Node, Edge, FlowExecutionRequest
-from app.blocks.base import BaseBlock, BlockResult  # noqa: F401 — BlockResult used in type hints
+from app.blocks.base import BaseBlock, BlockResult
+from app.blocks.registry import BLOCK_REGISTRY
 
 logger = logging.getLogger(__name__)
 
 
+class _NodeSpec(NamedTuple):
+    """Executor-internal view of a ``Node``: only the fields execution reads."""
+    id: str
+    type: str
+    config: Optional[Dict[str, Any]]  # None when the node has no config
+
+
+class _EdgeSpec(NamedTuple):
+    """Executor-internal view of an ``Edge``.
+
+    ``input_key`` is the key the source value is passed under: the target
+    handle, or the source node ID when the edge has no handle.
+    """
+    source: str
+    target: str
+    input_key: str
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert *value* into a hashable memo-key component.
+
+    Containers become frozensets/tuples recursively. Every component is tagged
+    with its type so values that compare equal across types (``1``, ``1.0``
+    and ``True``) do not share a cache entry. Unhashable leaf values raise
+    ``TypeError`` while the key is built or looked up; callers treat that as
+    "do not cache".
+    """
+    if isinstance(value, Mapping):
+        return (type(value), frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+class _PreparedNode(NamedTuple):
+    """A node ready to run: its block, its inputs and its memo key."""
+    block: BaseBlock
+    inputs: Dict[str, Any]
+    key: Optional[Hashable]  # None when the result is not memoized
+
+
+def _copy_result(result: BlockResult) -> BlockResult:
+    """Return a copy of *result* with its own metadata dict."""
+    metadata = result.metadata
+    return BlockResult(
+        success=result.success,
+        value=result.value,
+        error=result.error,
+        metadata=dict(metadata) if metadata is not None else None,
+    )
+
+
+# Worker pool for ``io_bound`` blocks, shared by every executor and created on
+# first use. Graphs made only of CPU-bound blocks never start a thread.
+_IO_POOL_MAX_WORKERS = 4
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Return the shared ``io_bound`` worker pool, creating it if needed."""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=_IO_POOL_MAX_WORKERS, thread_name_prefix="graph-io"
+                )
+    return _io_pool
+
+
 class CyclicGraphError(Exception):
     """Raised when a cyclic dependency is detected in the graph."""
     pass
@@ -27,55 +105,126 @@ class GraphExecutor:
     sorting and executing nodes in dependency order.
     """
 
-    def __init__(self, nodes: List[Node], edges: List[Edge]):
+    def __init__(self, nodes: List[Node], edges: List[Edge], memoize: bool = False):
         """
         Initialize the graph executor.
 
         Args:
             nodes: List of nodes in the flow graph
             edges: List of edges defining connections between nodes
+            memoize: Cache block results across ``execute()`` calls. Only
+                worth enabling for an executor that is run more than once;
+                a single run pays for building memo keys and never hits.
         """
-        self.nodes = {node.id: node for node in nodes}
-        self.edges = edges
+        # The request models are transcribed once into plain tuples holding
+        # only what execution reads; the Pydantic objects are not kept.
+        # IDs and handles are interned: each one parsed from JSON is a separate
+        # str object, and sharing one object per ID lets the results, in-degree
+        # and inputs dict lookups match on identity before comparing contents.
+        intern = sys.intern
+        self.nodes: Dict[str, _NodeSpec] = {}
+        for node in nodes:
+            node_id = intern(node.id)
+            self.nodes[node_id] = _NodeSpec(node_id, node.type, node.data.config or None)
+        self.edges: List[_EdgeSpec] = []
+        for edge in edges:
+            source = intern(edge.source)
+            self.edges.append(_EdgeSpec(
+                source, intern(edge.target), intern(edge.targetHandle or source)
+            ))
         self.results: Dict[str, BlockResult] = {}
 
-    def _build_adjacency_list(self) -> Dict[str, List[str]]:
-        """
-        Build an adjacency list representing node dependencies.
+        # Inbound-edge index (target node ID -> edges into it), built once so
+        # gathering a node's inputs costs O(in-degree) rather than O(E).
+        self._inbound: Dict[str, List[_EdgeSpec]] = defaultdict(list)
+        for edge in self.edges:
+            self._inbound[edge.target].append(edge)
 
-        Returns:
-            Dictionary mapping each node ID to a list of dependent node IDs
-        """
-        adjacency_list: Dict[str, List[str]] = defaultdict(list)
+        # Block instances, created on a node's first run and reused by later
+        # execute() calls so dispatch and config validation happen once.
+        self._blocks: Dict[str, BaseBlock] = {}
 
-        # Initialize all nodes in the adjacency list
-        for node_id in self.nodes.keys():
-            if node_id not in adjacency_list:
-                adjacency_list[node_id] = []
+        # Block results memoized across execute() calls, per node ID and keyed
+        # on the frozen (config, inputs) pair. Blocks are pure functions of
+        # those two, so re-running an unchanged graph is a dict lookup.
+        self._memoize = memoize
+        self._memo: Dict[str, Dict[Hashable, BlockResult]] = defaultdict(dict)
 
-        # Build edges: source -> target
-        for edge in self.edges:
-            adjacency_list[edge.source].append(edge.target)
+        # Adjacency list and initial in-degrees, built on first use. The graph
+        # structure is fixed for the executor's lifetime, so later sorts and
+        # runs only copy the in-degree counts instead of re-walking the edges.
+        self._graph: Optional[Tuple[Dict[str, List[str]], Dict[str, int]]] = None
 
-        return adjacency_list
+        # Topological order, kept after the first successful sort for the
+        # same reason; a cyclic graph is never cached and raises every time.
+        self._order: Optional[Tuple[str, ...]] = None
 
-    def _calculate_in_degrees(self, adjacency_list: Dict[str, List[str]]) -> Dict[str, int]:
+    def _build_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
         """
-        Calculate the in-degree (number of incoming edges) for each node.
+        Return the adjacency list and a fresh copy of the in-degree counts.
 
-        Args:
-            adjacency_list: Graph adjacency list
+        Both are built in one pass over the edges the first time this is
+        called. The adjacency list is shared between callers and must be
+        treated as read-only; the in-degree dict is theirs to consume.
 
         Returns:
-            Dictionary mapping node IDs to their in-degree counts
+            Tuple of (source -> target IDs, node ID -> in-degree). Nodes without
+            outgoing edges are filled in by the adjacency defaultdict on access.
         """
-        in_degrees: Dict[str, int] = {node_id: 0 for node_id in self.nodes.keys()}
-
-        for source, targets in adjacency_list.items():
-            for target in targets:
+        if self._graph is None:
+            adjacency_list: Dict[str, List[str]] = defaultdict(list)
+            in_degrees: Dict[str, int] = dict.fromkeys(self.nodes, 0)
+            # Edge specs are tuples, so unpacking replaces per-field attribute loads
+            for source, target, _ in self.edges:
+                adjacency_list[source].append(target)
                 in_degrees[target] += 1
+            self._graph = (adjacency_list, in_degrees)
+        adjacency_list, in_degrees = self._graph
+        return adjacency_list, in_degrees.copy()
+
+    def _raise_cycle_error(self) -> None:
+        """Log and raise the error for a graph Kahn's algorithm cannot drain."""
+        logger.error("Cyclic dependency detected in graph")
+        raise CyclicGraphError(
+            "Graph contains a cycle. Topological sort is not possible."
+        )
+
+    def _linear_chain_order(
+        self, adjacency_list: Dict[str, List[str]], in_degrees: Dict[str, int]
+    ) -> Optional[List[str]]:
+        """
+        Return the order of a graph that is a single chain A -> B -> ..., if it is one.
+
+        With N - 1 edges and exactly one root, every other node has in-degree
+        exactly 1, so following the lone successor from the root visits each
+        node once and the walk is the topological order.
+
+        Args:
+            adjacency_list: Graph adjacency list from ``_build_graph``
+            in_degrees: In-degree counts from ``_build_graph``
 
-        return in_degrees
+        Returns:
+            The chain's node IDs in order, or ``None`` if the graph is not a
+            single chain (callers then fall back to Kahn's algorithm)
+        """
+        node_count = len(self.nodes)
+        if node_count < 2 or len(self.edges) != node_count - 1:
+            return None
+
+        roots = [node_id for node_id, in_degree in in_degrees.items() if in_degree == 0]
+        if len(roots) != 1:
+            return None
+
+        current = roots[0]
+        order = [current]
+        for _ in range(node_count - 1):
+            # .get() so the defaultdict is not grown by the probe
+            successors = adjacency_list.get(current)
+            if successors is None or len(successors) != 1:
+                return None
+            current = successors[0]
+            order.append(current)
+        return order
 
     def topological_sort(self) -> List[str]:
         """
@@ -87,8 +236,16 @@ class GraphExecutor:
         Raises:
             CyclicGraphError: If the graph contains a cycle
         """
-        adjacency_list = self._build_adjacency_list()
-        in_degrees = self._calculate_in_degrees(adjacency_list)
+        if self._order is not None:
+            return list(self._order)
+
+        adjacency_list, in_degrees = self._build_graph()
+
+        chain = self._linear_chain_order(adjacency_list, in_degrees)
+        if chain is not None:
+            logger.debug("Topological sort order (linear chain): %s", chain)
+            self._order = tuple(chain)
+            return chain
 
         # Queue for nodes with no incoming edges
         queue: Deque[str] = deque()
@@ -100,27 +257,31 @@ class GraphExecutor:
 
         sorted_order: List[str] = []
 
+        # Bound methods are hoisted out of the loop
+        queue_pop = queue.popleft
+        queue_append = queue.append
+        order_append = sorted_order.append
+
         while queue:
             # Remove a node from the queue
-            current_node = queue.popleft()
-            sorted_order.append(current_node)
+            current_node = queue_pop()
+            order_append(current_node)
 
             # Reduce in-degree for all neighbors
             for neighbor in adjacency_list[current_node]:
-                in_degrees[neighbor] -= 1
+                remaining = in_degrees[neighbor] - 1
+                in_degrees[neighbor] = remaining
 
                 # If in-degree becomes 0, add to queue
-                if in_degrees[neighbor] == 0:
-                    queue.append(neighbor)
+                if remaining == 0:
+                    queue_append(neighbor)
 
         # Check if all nodes were processed (no cycle)
         if len(sorted_order) != len(self.nodes):
-            logger.error("Cyclic dependency detected in graph")
-            raise CyclicGraphError(
-                "Graph contains a cycle. Topological sort is not possible."
-            )
+            self._raise_cycle_error()
 
-        logger.debug(f"Topological sort order: {sorted_order}")
+        logger.debug("Topological sort order: %s", sorted_order)
+        self._order = tuple(sorted_order)
         return sorted_order
 
     def _get_node_inputs(self, node_id: str) -> Dict[str, Any]:
@@ -134,25 +295,43 @@ class GraphExecutor:
             Dictionary mapping input handle IDs to their values
         """
         inputs: Dict[str, Any] = {}
-
-        # Find all edges that target this node
-        for edge in self.edges:
-            if edge.target == node_id:
-                source_result = self.results.get(edge.source)
-                if source_result and source_result.success:
-                    # Use the target handle as the key, or source ID if no handle
-                    input_key = edge.targetHandle or edge.source
-                    inputs[input_key] = source_result.value
-                elif source_result and not source_result.success:
-                    # Propagate error from upstream node
-                    logger.warning(
-                        f"Upstream node {edge.source} failed, propagating error to {node_id}"
-                    )
-                    inputs[edge.targetHandle or edge.source] = None
+        results_get = self.results.get
+
+        # Walk only the edges that target this node
+        for source, _, input_key in self._inbound.get(node_id, ()):
+            source_result = results_get(source)
+            if source_result is None:
+                continue
+            if source_result.success:
+                # Keyed by the target handle, or source ID if no handle
+                inputs[input_key] = source_result.value
+            else:
+                # Propagate error from upstream node
+                logger.warning(
+                    f"Upstream node {source} failed, propagating error to {node_id}"
+                )
+                inputs[input_key] = None
 
         return inputs
 
-    def _instantiate_block(self, node: Node) -> BaseBlock:
+    def _failed_upstream(self, node_id: str) -> Optional[str]:
+        """
+        Return the ID of the first upstream node whose result is a failure.
+
+        Args:
+            node_id: ID of the node whose inbound edges are checked
+
+        Returns:
+            The failed source node ID, or ``None`` if no upstream has failed
+        """
+        results_get = self.results.get
+        for source, _, _ in self._inbound.get(node_id, ()):
+            source_result = results_get(source)
+            if source_result is not None and not source_result.success:
+                return source
+        return None
+
+    def _instantiate_block(self, node: _NodeSpec) -> BaseBlock:
         """
         Instantiate the appropriate BaseBlock subclass for a node.
 
@@ -165,37 +344,233 @@ class GraphExecutor:
         Raises:
             NotImplementedError: If the node type is not yet implemented
         """
-        # Import block types from their respective sub-packages
-        from app.blocks.io.input_blocks import TextInputBlock, NumberInputBlock
-        from app.blocks.io.output_blocks import TextOutputBlock, NumberOutputBlock
-        from app.blocks.logic.math_blocks import MathOperationBlock
-        from app.blocks.logic.text_blocks import TextJoinBlock
-
-        # Block registry mapping node types to block classes
-        BLOCK_REGISTRY = {
-            "text_input": TextInputBlock,
-            "number_input": NumberInputBlock,
-            "text_output": TextOutputBlock,
-            "number_output": NumberOutputBlock,
-            "math_operation": MathOperationBlock,
-            "text_join": TextJoinBlock,
-        }
-        
         # Get the block class for this node type
         block_class = BLOCK_REGISTRY.get(node.type)
-        
+
         if block_class is None:
             raise NotImplementedError(
                 f"Block type '{node.type}' is not yet implemented. "
                 f"Available types: {', '.join(BLOCK_REGISTRY.keys())}"
             )
-        
-        # Instantiate the block with node configuration
-        return block_class(
-            node_id=node.id,
-            config=node.data.config if node.data.config else {}
+
+        # Instantiate the block with node configuration; an empty config was
+        # mapped to None at ingestion, which BaseBlock turns into its shared
+        # read-only default.
+        return block_class(node_id=node.id, config=node.config)
+
+    def invalidate(self, node_id: str) -> None:
+        """
+        Drop memoized results for a node and everything downstream of it.
+
+        Memo keys already cover config and inputs, so this is only needed
+        when something outside them changes what a block would return.
+
+        Args:
+            node_id: ID of the node whose results should be recomputed
+        """
+        adjacency_list, _ = self._build_graph()
+        stack = [node_id]
+        seen: Set[str] = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            self._memo.pop(current, None)
+            stack.extend(adjacency_list.get(current, ()))
+
+    def _run_node(self, node_id: str) -> BlockResult:
+        """
+        Gather inputs for one node, run its block and return the result.
+
+        Block failures are captured in the returned ``BlockResult`` rather
+        than raised, so one node cannot abort the rest of the graph.
+
+        Args:
+            node_id: ID of the node to execute
+
+        Returns:
+            The node's ``BlockResult``
+        """
+        prepared = self._prepare_node(node_id)
+        if isinstance(prepared, BlockResult):
+            return prepared
+        block, inputs, key = prepared
+        return self._finish_node(node_id, key, self._call_block(node_id, block, inputs))
+
+    def _prepare_node(self, node_id: str) -> Union[BlockResult, _PreparedNode]:
+        """
+        Do everything for one node that happens before its block runs.
+
+        Decides whether the node is skipped or served from the memo, gathers
+        its inputs and creates (or reuses) its block instance. Executor state
+        is only read and written here and in ``_finish_node``, which the
+        scheduling thread runs; only ``_call_block`` may run on a worker.
+
+        Args:
+            node_id: ID of the node to execute
+
+        Returns:
+            The node's final ``BlockResult`` if its block does not need to
+            run, otherwise the block, its inputs and the memo key to store
+            the result under (``None`` when the result is not memoized)
+        """
+        node = self.nodes[node_id]
+        logger.info("Executing node: %s (type: %s)", node_id, node.type)
+
+        try:
+            # A node that needs all of its inputs cannot succeed once one
+            # upstream has failed; skipping it fails the rest of the doomed
+            # subgraph the same way without running any of its blocks.
+            block_class = BLOCK_REGISTRY.get(node.type)
+            if block_class is not None and block_class.requires_all_inputs:
+                failed = self._failed_upstream(node_id)
+                if failed is not None:
+                    logger.warning(
+                        "Skipping node %s: upstream node %s failed", node_id, failed
+                    )
+                    return BlockResult(
+                        success=False,
+                        value=None,
+                        error=f"Skipped: upstream node '{failed}' failed"
+                    )
+
+            # Get inputs from previously executed nodes
+            inputs = self._get_node_inputs(node_id)
+
+            # Reuse the result of an identical earlier run of this node. The
+            # memo holds its own copy and hands out copies, so callers of one
+            # execute() cannot change what a later one returns.
+            key: Optional[Hashable] = None
+            if self._memoize:
+                try:
+                    key = (_freeze(node.config), _freeze(inputs))
+                    cached = self._memo[node_id].get(key)
+                except TypeError:  # unhashable config or input value
+                    key = cached = None
+                if cached is not None:
+                    logger.debug("Node %s served from memo", node_id)
+                    return _copy_result(cached)
+
+            # NOTE: This will raise NotImplementedError until block types are implemented
+            block = self._blocks.get(node_id)
+            if block is None:
+                block = self._blocks[node_id] = self._instantiate_block(node)
+            return _PreparedNode(block, inputs, key)
+
+        except Exception as e:
+            return self._error_result(node_id, e)
+
+    def _call_block(
+        self, node_id: str, block: BaseBlock, inputs: Dict[str, Any]
+    ) -> BlockResult:
+        """
+        Run *block* on *inputs*, turning an exception into a failed result.
+
+        Touches no executor state, so it is safe to run on a worker thread.
+        """
+        try:
+            return block.run(inputs)
+        except Exception as e:
+            return self._error_result(node_id, e)
+
+    def _finish_node(
+        self, node_id: str, key: Optional[Hashable], result: BlockResult
+    ) -> BlockResult:
+        """Memoize *result* under *key* (if any), log it and return it."""
+        if key is not None:
+            self._memo[node_id][key] = _copy_result(result)
+
+        if result.success:
+            logger.info("Node %s executed successfully", node_id)
+        else:
+            logger.error(
+                f"Node {node_id} execution failed: {result.error}"
+            )
+        return result
+
+    def _error_result(self, node_id: str, e: Exception) -> BlockResult:
+        """Log an exception raised while executing a node and wrap it in a result."""
+        if isinstance(e, NotImplementedError):
+            # For MVP, we'll create a placeholder result
+            logger.warning(f"Block not implemented for node {node_id}: {str(e)}")
+            return BlockResult(
+                success=False,
+                value=None,
+                error=str(e)
+            )
+
+        # Tracebacks only at DEBUG; the message already names the error
+        logger.error(
+            "Unexpected error executing node %s: %s",
+            node_id,
+            e,
+            exc_info=e if logger.isEnabledFor(logging.DEBUG) else None
+        )
+        return BlockResult(
+            success=False,
+            value=None,
+            error=f"Execution error: {str(e)}"
+        )
+
+    def _schedule(
+        self, adjacency_list: Dict[str, List[str]], in_degrees: Dict[str, int]
+    ) -> None:
+        """
+        Run every node as soon as all of its upstream nodes have finished.
+
+        Ready nodes run inline in the calling thread, first in first out.
+        Nodes whose block class sets ``io_bound`` are prepared here and
+        their block's ``run()`` is submitted to the shared I/O pool; while
+        any are in flight the inline nodes keep draining, and each
+        completion is finished here and releases its successors. Workers
+        only call ``_call_block``: the calling thread is the only one that
+        touches ``in_degrees``, ``self.results``, the block cache and the
+        memo.
+
+        Args:
+            adjacency_list: Graph adjacency list from ``_build_graph``
+            in_degrees: In-degree counts from ``_build_graph``; consumed
+        """
+        results = self.results
+        nodes = self.nodes
+        registry_get = BLOCK_REGISTRY.get
+        ready: Deque[str] = deque(
+            node_id for node_id, in_degree in in_degrees.items() if in_degree == 0
         )
+        pending: Dict[Future, Tuple[str, Optional[Hashable]]] = {}
+
+        def release(node_id: str) -> None:
+            for neighbor in adjacency_list[node_id]:
+                remaining = in_degrees[neighbor] - 1
+                in_degrees[neighbor] = remaining
+                if remaining == 0:
+                    ready.append(neighbor)
+
+        while ready or pending:
+            while ready:
+                node_id = ready.popleft()
+                block_class = registry_get(nodes[node_id].type)
+                if block_class is not None and block_class.io_bound:
+                    prepared = self._prepare_node(node_id)
+                    if not isinstance(prepared, BlockResult):
+                        block, inputs, key = prepared
+                        future = _get_io_pool().submit(
+                            self._call_block, node_id, block, inputs
+                        )
+                        pending[future] = (node_id, key)
+                        continue
+                    results[node_id] = prepared
+                else:
+                    results[node_id] = self._run_node(node_id)
+                release(node_id)
 
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id, key = pending.pop(future)
+                    results[node_id] = self._finish_node(node_id, key, future.result())
+                    release(node_id)
 
     def execute(self) -> Dict[str, Any]:
         """
@@ -213,61 +588,22 @@ class GraphExecutor:
 
         logger.info(f"Starting graph execution with {len(self.nodes)} nodes")
 
-        # Get execution order
+        # Validate the graph and fix the response order up front, so a cyclic
+        # graph is rejected before any block runs
         try:
             execution_order = self.topological_sort()
         except CyclicGraphError as e:
             logger.error(f"Graph validation failed: {str(e)}")
             raise
 
-        # Execute nodes in order
-        for node_id in execution_order:
-            node = self.nodes[node_id]
-            logger.info(f"Executing node: {node_id} (type: {node.type})")
-
-            try:
-                # Get inputs from previously executed nodes
-                inputs = self._get_node_inputs(node_id)
-
-                # Instantiate and execute the block
-                # NOTE: This will raise NotImplementedError until block types are implemented
-                block = self._instantiate_block(node)
-                result = block.run(inputs)
-
-                # Store result for downstream nodes
-                self.results[node_id] = result
-
-                if result.success:
-                    logger.info(f"Node {node_id} executed successfully")
-                else:
-                    logger.error(
-                        f"Node {node_id} execution failed: {result.error}"
-                    )
-
-            except NotImplementedError as e:
-                # For MVP, we'll create a placeholder result
-                logger.warning(f"Block not implemented for node {node_id}: {str(e)}")
-                self.results[node_id] = BlockResult(
-                    success=False,
-                    value=None,
-                    error=str(e)
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error executing node {node_id}: {str(e)}",
-                    exc_info=True
-                )
-                self.results[node_id] = BlockResult(
-                    success=False,
-                    value=None,
-                    error=f"Execution error: {str(e)}"
-                )
+        self._schedule(*self._build_graph())
 
         execution_time = time.time() - start_time
         logger.info(f"Graph execution completed in {execution_time:.3f} seconds")
 
-        # Convert BlockResult objects to dictionaries for API response
+        # Convert BlockResult objects to dictionaries for API response, in
+        # topological order regardless of which worker finished first
+        results = self.results
         return {
-            node_id: result.model_dump() for node_id, result in self.results.items()
+            node_id: results[node_id].model_dump() for node_id in execution_order
         }
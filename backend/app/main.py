@@ -1,9 +1,13 @@
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.schemas import FlowExecutionRequest
+from app.schemas import FlowBatchRequest, FlowExecutionRequest
 from app.engine.graph_executor import GraphExecutor, CyclicGraphError
 
 # Setup Logging
@@ -30,6 +34,70 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Serialized responses of recently executed flows, keyed on a digest of the
+# raw request body. This assumes results are a pure function of the body:
+# blocks depend only on their config and inputs, so an identical payload
+# always produces identical results and can skip building, sorting and
+# running the graph. Entries are stored as JSON bytes so no caller can mutate
+# them, and the least recently used ones are evicted; there is no expiry.
+_RESULT_CACHE_SIZE = 128
+_result_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# Encodes engine responses to JSON bytes in pydantic-core, the same path
+# FastAPI takes for a declared return type (non-finite floats become null).
+# Both engine endpoints go through it, so a flow's results are encoded the
+# same way whether it ran alone or in a batch.
+_RESPONSE_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def clear_result_cache() -> None:
+    """Drop every cached flow result, e.g. between tests."""
+    _result_cache.clear()
+
+
+def _json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Wrap JSON bytes from ``_RESPONSE_ADAPTER`` in a response."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _execution_error(exc: Exception, action: str) -> HTTPException:
+    """
+    Log a failed flow execution and map it to the HTTP error to raise.
+
+    Cyclic graphs are client errors (400), unimplemented block types are
+    501 and anything else is a 500 naming *action*.
+    """
+    if isinstance(exc, CyclicGraphError):
+        logger.error(f"Cyclic graph detected: {str(exc)}")
+        return HTTPException(
+            status_code=400,
+            detail=f"Invalid graph structure: {str(exc)}"
+        )
+
+    if isinstance(exc, NotImplementedError):
+        logger.warning(f"Block type not implemented: {str(exc)}")
+        return HTTPException(
+            status_code=501,
+            detail=f"Feature not yet implemented: {str(exc)}"
+        )
+
+    logger.error(f"Error during {action}: {str(exc)}", exc_info=exc)
+    return HTTPException(
+        status_code=500,
+        detail=f"Internal Server Error during {action}: {str(exc)}"
+    )
+
+async def _execute_flow(flow: FlowExecutionRequest) -> Dict[str, Any]:
+    """
+    Build and execute one flow's graph off the event loop.
+
+    Runs on the default thread pool so a long-running flow does not block
+    other requests on this worker.
+    """
+    executor = GraphExecutor(nodes=flow.nodes, edges=flow.edges)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, executor.execute)
+
 @app.get("/api/v1/health")
 async def health_check() -> Dict[str, str]:
     """
@@ -39,7 +107,7 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok", "version": "0.1.0", "service": "AetherLoom Cortex"}
 
 @app.post("/api/v1/engine/run")
-async def run_flow(request: FlowExecutionRequest) -> Dict[str, Any]:
+async def run_flow(request: FlowExecutionRequest, raw_request: Request) -> Response:
     """
     Execute a flow based on the provided nodes and edges.
     
@@ -49,36 +117,52 @@ async def run_flow(request: FlowExecutionRequest) -> Dict[str, Any]:
     3. Validate for cyclic dependencies.
     4. Execute nodes in dependency order.
     5. Return structured execution results.
+
+    Successful results are cached per request body, on the assumption that
+    they depend on nothing else. The response body is the JSON object that
+    maps node IDs to results, and the ``X-Cache`` header reports ``HIT`` or
+    ``MISS``.
     """
+    cache_key = hashlib.blake2b(await raw_request.body(), digest_size=16).digest()
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        _result_cache.move_to_end(cache_key)
+        logger.info("Flow execution served from result cache")
+        return _json_response(cached, {"X-Cache": "HIT"})
+
     logger.info(f"Received flow execution request: {len(request.nodes)} nodes, {len(request.edges)} edges")
     
     try:
-        # Initialize the graph executor
-        executor = GraphExecutor(nodes=request.nodes, edges=request.edges)
-        
-        # Execute the flow graph
-        results = executor.execute()
+        results = await _execute_flow(request)
         
         logger.info("Flow execution processing completed successfully")
-        return results
+        body = _RESPONSE_ADAPTER.dump_json(results)
+    except Exception as e:
+        raise _execution_error(e, "flow execution")
 
-    except CyclicGraphError as e:
-        logger.error(f"Cyclic graph detected: {str(e)}")
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid graph structure: {str(e)}"
-        )
-    
-    except NotImplementedError as e:
-        logger.warning(f"Block type not implemented: {str(e)}")
-        raise HTTPException(
-            status_code=501,
-            detail=f"Feature not yet implemented: {str(e)}"
-        )
-    
+    _result_cache[cache_key] = body
+    if len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return _json_response(body, {"X-Cache": "MISS"})
+
+
+@app.post("/api/v1/engine/run-batch")
+async def run_flow_batch(request: FlowBatchRequest) -> Response:
+    """
+    Execute several independent flows in one request.
+
+    The flows run concurrently and the response body is
+    ``{"results": [...]}``, in request order, each entry encoded exactly
+    like a ``/api/v1/engine/run`` response. The batch is rejected as a
+    whole if any flow is invalid.
+    """
+    logger.info("Received batch execution request: %d flows", len(request.flows))
+
+    try:
+        results = await asyncio.gather(*(_execute_flow(flow) for flow in request.flows))
+        logger.info("Batch execution processing completed successfully")
+        body = _RESPONSE_ADAPTER.dump_json({"results": list(results)})
     except Exception as e:
-        logger.error(f"Error during flow execution: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Internal Server Error during flow execution: {str(e)}"
-        )
+        raise _execution_error(e, "batch execution")
+
+    return _json_response(body)
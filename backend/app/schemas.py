@@ -38,6 +38,12 @@ class FlowExecutionRequest(BaseModel):
     nodes: List[Node]
     edges: List[Edge]
 
+class FlowBatchRequest(BaseModel):
+    """
+    Request model for executing several independent flows in one call.
+    """
+    flows: List[FlowExecutionRequest]
+
 
 # ============================================================================
 # Block Configuration Schemas
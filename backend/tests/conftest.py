@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    A single TestClient for the whole session.
+
+    Entering it as a context manager keeps one event-loop portal (and the
+    app's lifespan) alive across requests, instead of starting a new portal
+    for every call a bare client makes. The app and the test client are
+    imported here, so runs that select no integration test never build the
+    FastAPI app.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """
+    Empty the API's flow result cache after every test.
+
+    The session-scoped client shares one app, so without this a cached
+    response from one test would be served to another posting the same
+    body. Only acts once ``app.main`` has been imported by some test.
+    """
+    yield
+    main = sys.modules.get("app.main")
+    if main is not None:
+        main.clear_result_cache()
@@ -5,6 +5,8 @@ Unit tests for the BaseBlock abstract class and BlockResult model.
 import pytest
 from typing import Dict, Any
 
+from pydantic import BaseModel
+
 from app.blocks.base import BaseBlock, BlockResult
 
 
@@ -82,6 +84,13 @@ class TestBlockResult:
         assert result_dict["value"] == {"key": "value"}
         assert result_dict["metadata"] == {"test": True}
 
+    def test_block_result_is_slotted(self):
+        """BlockResult instances carry no per-instance __dict__."""
+        result = BlockResult(success=True, value=1)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True  # type: ignore[attr-defined]
+
 
 class TestBaseBlock:
     """Test cases for BaseBlock abstract class."""
@@ -98,6 +107,14 @@ class TestBaseBlock:
         assert block.node_id == "test-node-2"
         assert block.config == {}
 
+    def test_base_block_default_config_is_not_shared_mutable_state(self):
+        """Blocks built without config cannot leak changes into each other."""
+        first = MockBlock(node_id="test-node-2a")
+        second = MockBlock(node_id="test-node-2b")
+        with pytest.raises(TypeError):
+            first.config["leak"] = True  # type: ignore[index]
+        assert second.config == {}
+
     def test_base_block_run_with_no_inputs(self):
         """Test running a block with no inputs."""
         block = MockBlock(node_id="test-node-3", config={})
@@ -128,3 +145,55 @@ class TestBaseBlock:
         
         with pytest.raises(TypeError):
             IncompleteBlock(node_id="test", config={})  # type: ignore
+
+
+class _CountConfig(BaseModel):
+    count: int = 0
+
+
+class ConfiguredBlock(BaseBlock):
+    """Block that declares a config model and re-validates on config swaps."""
+
+    config_model = _CountConfig
+
+    def run(self, inputs: Dict[str, Any]) -> BlockResult:
+        if self.config is not self._cfg_source:
+            self._load_config()
+        if self._cfg_error is not None:
+            return self._invalid_config_result(self._cfg_error)
+        return BlockResult(success=True, value=self._cfg.count)
+
+
+class TestConfigModel:
+    """BaseBlock validates ``config_model`` once per config object."""
+
+    def test_config_validated_once_per_identity(self, monkeypatch):
+        """Repeated runs reuse the parsed model; a new dict is re-validated."""
+        calls = []
+        original = _CountConfig.model_validate.__func__
+
+        def counting(cls, obj, *args, **kwargs):
+            calls.append(obj)
+            return original(cls, obj, *args, **kwargs)
+
+        monkeypatch.setattr(_CountConfig, "model_validate", classmethod(counting))
+        block = ConfiguredBlock(node_id="cfg", config={"count": 1})
+        assert block.run({}).value == 1
+        assert block.run({}).value == 1
+        assert len(calls) == 1
+
+        block.config = {"count": 2}
+        assert block.run({}).value == 2
+        assert len(calls) == 2
+
+    def test_invalid_config_reported_as_failed_result(self):
+        """A cached ValidationError becomes a failed BlockResult."""
+        block = ConfiguredBlock(node_id="cfg", config={"count": "many"})
+        result = block.run({})
+        assert result.success is False
+        assert result.error
+
+    def test_from_trusted_config_skips_validation(self):
+        """from_trusted_config stores the model without running validators."""
+        block = ConfiguredBlock.from_trusted_config("cfg", {"count": 5})
+        assert block.run({}).value == 5
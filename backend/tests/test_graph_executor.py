@@ -140,6 +140,71 @@ class TestTopologicalSort:
         
         assert len(sorted_order) == 6
 
+    def test_repeated_sorts_do_not_consume_graph(self):
+        """Test that sorting twice yields the same order from the cached graph."""
+        nodes = [
+            Node(id="A", type="input", data=NodeData(label="A")),
+            Node(id="B", type="input", data=NodeData(label="B")),
+            Node(id="C", type="processor", data=NodeData(label="C")),
+        ]
+        edges = [
+            Edge(id="e1", source="A", target="C"),
+            Edge(id="e2", source="B", target="C"),
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        first = executor.topological_sort()
+
+        executor._build_graph()[1].clear()  # callers consume their copy
+        assert executor.topological_sort() == first == ["A", "B", "C"]
+
+    def test_cached_order_is_a_fresh_list(self):
+        """Test that mutating a returned order does not affect later sorts."""
+        nodes = [
+            Node(id="A", type="input", data=NodeData(label="A")),
+            Node(id="B", type="output", data=NodeData(label="B")),
+        ]
+        edges = [Edge(id="e1", source="A", target="B")]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        executor.topological_sort().reverse()
+
+        assert executor.topological_sort() == ["A", "B"]
+
+
+class TestLinearChainFastPath:
+    """Test cases for the single-chain shortcut in topological_sort."""
+
+    def test_chain_declared_out_of_order(self):
+        """A chain is walked from its root regardless of node declaration order."""
+        nodes = [
+            Node(id="C", type="output", data=NodeData(label="C")),
+            Node(id="A", type="input", data=NodeData(label="A")),
+            Node(id="B", type="processor", data=NodeData(label="B")),
+        ]
+        edges = [
+            Edge(id="e1", source="A", target="B"),
+            Edge(id="e2", source="B", target="C"),
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        assert executor.topological_sort() == ["A", "B", "C"]
+
+    def test_tree_with_n_minus_one_edges_falls_back(self):
+        """A fan-out tree has N - 1 edges and one root but is not a chain."""
+        nodes = [
+            Node(id="A", type="input", data=NodeData(label="A")),
+            Node(id="B", type="processor", data=NodeData(label="B")),
+            Node(id="C", type="processor", data=NodeData(label="C")),
+        ]
+        edges = [
+            Edge(id="e1", source="A", target="B"),
+            Edge(id="e2", source="A", target="C"),
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        assert executor.topological_sort() == ["A", "B", "C"]
+
 
 class TestCycleDetection:
     """Test cases for cycle detection in graphs."""
@@ -282,6 +347,22 @@ class TestGraphExecutorInputs:
         assert "input1" in inputs
         assert inputs["input1"] is None
 
+    def test_edge_ids_share_node_id_objects(self):
+        """Test that edge endpoints are interned to the node's own ID object."""
+        node_id, edge_source = "".join(["no", "de"]), "".join(["n", "ode"])
+        assert node_id is not edge_source
+        nodes = [
+            Node(id=node_id, type="input", data=NodeData(label="A")),
+            Node(id="B", type="processor", data=NodeData(label="B")),
+        ]
+        edges = [Edge(id="e1", source=edge_source, target="B")]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+
+        stored_id = next(iter(executor.nodes))
+        assert executor.edges[0].source is stored_id
+        assert executor.edges[0].input_key is stored_id
+
 
 class TestGraphExecutorExecution:
     """Test cases for graph execution."""
@@ -334,3 +415,273 @@ class TestGraphExecutorExecution:
         assert isinstance(results["A"], dict)
         assert "success" in results["A"]
         assert "value" in results["A"]
+
+    def test_execute_wide_level_runs_every_node(self):
+        """Independent nodes in one level all produce results."""
+        nodes = [
+            Node(
+                id=f"n{i}",
+                type="number_input",
+                data=NodeData(label=f"N{i}", config={"value": i}),
+            )
+            for i in range(4)
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=[])
+        results = executor.execute()
+
+        assert list(results) == ["n0", "n1", "n2", "n3"]
+        assert [results[f"n{i}"]["value"] for i in range(4)] == [0, 1, 2, 3]
+
+    def test_execute_fan_out_fan_in(self):
+        """Parallel branches feed a join node once both have finished."""
+        nodes = [
+            Node(id="x", type="number_input", data=NodeData(label="X", config={"value": 2})),
+            Node(id="y", type="number_input", data=NodeData(label="Y", config={"value": 3})),
+            Node(id="sum", type="math_operation", data=NodeData(label="Sum", config={"operation": "add"})),
+            Node(id="prod", type="math_operation", data=NodeData(label="Prod", config={"operation": "multiply"})),
+            Node(id="join", type="text_join", data=NodeData(label="Join", config={"separator": "|"})),
+        ]
+        edges = [
+            Edge(id="e1", source="x", target="sum", targetHandle="a"),
+            Edge(id="e2", source="y", target="sum", targetHandle="b"),
+            Edge(id="e3", source="x", target="prod", targetHandle="a"),
+            Edge(id="e4", source="y", target="prod", targetHandle="b"),
+            Edge(id="e5", source="sum", target="join", targetHandle="a"),
+            Edge(id="e6", source="prod", target="join", targetHandle="b"),
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        results = executor.execute()
+
+        assert list(results) == executor.topological_sort()
+        assert results["join"]["success"] is True
+        assert results["join"]["value"] == "5|6"
+
+    def test_failed_upstream_skips_dependents(self, monkeypatch):
+        """Nodes needing all inputs are skipped below a failure; tolerant ones run."""
+        from app.blocks.logic.math_blocks import MathOperationBlock
+
+        ran = []
+        original = MathOperationBlock.run
+
+        def recording_run(self, inputs):
+            ran.append(self.node_id)
+            return original(self, inputs)
+
+        monkeypatch.setattr(MathOperationBlock, "run", recording_run)
+
+        nodes = [
+            Node(id="x", type="number_input", data=NodeData(label="X", config={"value": 1})),
+            Node(id="zero", type="number_input", data=NodeData(label="Zero", config={"value": 0})),
+            Node(id="div", type="math_operation", data=NodeData(label="Div", config={"operation": "divide"})),
+            Node(id="add", type="math_operation", data=NodeData(label="Add", config={"operation": "add"})),
+            Node(id="num_out", type="number_output", data=NodeData(label="Out")),
+            Node(id="text_out", type="text_output", data=NodeData(label="Text")),
+        ]
+        edges = [
+            Edge(id="e1", source="x", target="div", targetHandle="a"),
+            Edge(id="e2", source="zero", target="div", targetHandle="b"),
+            Edge(id="e3", source="div", target="add", targetHandle="a"),
+            Edge(id="e4", source="x", target="add", targetHandle="b"),
+            Edge(id="e5", source="add", target="num_out"),
+            Edge(id="e6", source="div", target="text_out"),
+        ]
+
+        executor = GraphExecutor(nodes=nodes, edges=edges)
+        results = executor.execute()
+
+        assert results["div"]["success"] is False
+        assert results["add"]["error"] == "Skipped: upstream node 'div' failed"
+        assert results["num_out"]["error"] == "Skipped: upstream node 'add' failed"
+        assert ran == ["div"]
+        assert results["text_out"]["success"] is True
+
+
+    def test_default_path_runs_inline(self, monkeypatch):
+        """CPU-bound blocks run in the calling thread, even in a wide level."""
+        import threading
+        from app.engine import graph_executor
+        from app.blocks.io.input_blocks import NumberInputBlock
+
+        def no_pool():
+            raise AssertionError("default path must not use the worker pool")
+
+        monkeypatch.setattr(graph_executor, "_get_io_pool", no_pool)
+        threads = set()
+        original = NumberInputBlock.run
+
+        def recording_run(self, inputs):
+            threads.add(threading.get_ident())
+            return original(self, inputs)
+
+        monkeypatch.setattr(NumberInputBlock, "run", recording_run)
+        nodes = [
+            Node(id=f"n{i}", type="number_input", data=NodeData(label=f"N{i}", config={"value": i}))
+            for i in range(4)
+        ]
+
+        results = GraphExecutor(nodes=nodes, edges=[]).execute()
+
+        assert all(result["success"] for result in results.values())
+        assert threads == {threading.get_ident()}
+
+    def test_io_bound_blocks_run_on_shared_pool(self, monkeypatch):
+        """Blocks that opt in with io_bound run on the shared worker threads."""
+        import threading
+        from app.blocks.io.input_blocks import NumberInputBlock
+
+        thread_names = []
+        original = NumberInputBlock.run
+
+        def recording_run(self, inputs):
+            thread_names.append(threading.current_thread().name)
+            return original(self, inputs)
+
+        monkeypatch.setattr(NumberInputBlock, "run", recording_run)
+        monkeypatch.setattr(NumberInputBlock, "io_bound", True)
+        nodes = [
+            Node(id="x", type="number_input", data=NodeData(label="X", config={"value": 2})),
+            Node(id="y", type="number_input", data=NodeData(label="Y", config={"value": 3})),
+            Node(id="sum", type="math_operation", data=NodeData(label="Sum", config={"operation": "add"})),
+        ]
+        edges = [
+            Edge(id="e1", source="x", target="sum", targetHandle="a"),
+            Edge(id="e2", source="y", target="sum", targetHandle="b"),
+        ]
+
+        results = GraphExecutor(nodes=nodes, edges=edges).execute()
+
+        assert results["sum"]["value"] == 5
+        assert len(thread_names) == 2
+        assert all(name.startswith("graph-io") for name in thread_names)
+
+
+    def test_concurrent_io_bound_nodes_leave_state_to_scheduler(self, monkeypatch):
+        """Two io_bound blocks overlap on workers; only the caller touches executor state."""
+        import threading
+        from app.blocks.io.input_blocks import NumberInputBlock
+
+        barrier = threading.Barrier(2, timeout=5)
+        original = NumberInputBlock.run
+
+        def overlapping_run(self, inputs):
+            barrier.wait()  # both blocks must be running at once to pass
+            return original(self, inputs)
+
+        monkeypatch.setattr(NumberInputBlock, "run", overlapping_run)
+        monkeypatch.setattr(NumberInputBlock, "io_bound", True)
+
+        state_threads = set()
+        for name in ("_prepare_node", "_finish_node"):
+            method = getattr(GraphExecutor, name)
+
+            def recording(self, *args, _method=method):
+                state_threads.add(threading.get_ident())
+                return _method(self, *args)
+
+            monkeypatch.setattr(GraphExecutor, name, recording)
+
+        nodes = [
+            Node(id="x", type="number_input", data=NodeData(label="X", config={"value": 2})),
+            Node(id="y", type="number_input", data=NodeData(label="Y", config={"value": 3})),
+            Node(id="sum", type="math_operation", data=NodeData(label="Sum", config={"operation": "add"})),
+        ]
+        edges = [
+            Edge(id="e1", source="x", target="sum", targetHandle="a"),
+            Edge(id="e2", source="y", target="sum", targetHandle="b"),
+        ]
+        executor = GraphExecutor(nodes=nodes, edges=edges, memoize=True)
+
+        results = executor.execute()
+
+        assert results["sum"]["value"] == 5
+        assert state_threads == {threading.get_ident()}
+        assert set(executor._blocks) == {"x", "y", "sum"}
+        assert all(executor._memo[node_id] for node_id in ("x", "y", "sum"))
+
+class TestExecutionMemo:
+    """Test cases for memoizing block results across execute() calls."""
+
+    @staticmethod
+    def _count_runs(monkeypatch):
+        """Patch NumberInputBlock.run to record each node it runs for."""
+        from app.blocks.io.input_blocks import NumberInputBlock
+
+        calls = []
+        original = NumberInputBlock.run
+
+        def counting_run(self, inputs):
+            calls.append(self.node_id)
+            return original(self, inputs)
+
+        monkeypatch.setattr(NumberInputBlock, "run", counting_run)
+        return calls
+
+    def test_repeat_execute_reuses_results(self, monkeypatch):
+        """A second execute() of an unchanged graph does not re-run blocks."""
+        calls = self._count_runs(monkeypatch)
+        nodes = [
+            Node(id="n", type="number_input", data=NodeData(label="N", config={"value": 7})),
+        ]
+        executor = GraphExecutor(nodes=nodes, edges=[], memoize=True)
+
+        first = executor.execute()
+        second = executor.execute()
+
+        assert first == second
+        assert calls == ["n"]
+
+    def test_invalidate_forces_rerun(self, monkeypatch):
+        """invalidate() drops the node's memo entry so it runs again."""
+        calls = self._count_runs(monkeypatch)
+        nodes = [
+            Node(id="n", type="number_input", data=NodeData(label="N", config={"value": 7})),
+        ]
+        executor = GraphExecutor(nodes=nodes, edges=[], memoize=True)
+
+        executor.execute()
+        executor.invalidate("n")
+        executor.execute()
+
+        assert calls == ["n", "n"]
+
+    def test_memo_key_distinguishes_equal_values_of_other_types(self):
+        """True and 1 hash equal but must not share a memo entry."""
+        executor = GraphExecutor(
+            nodes=[Node(id="m", type="math_operation", data=NodeData(label="M", config={"operation": "add"}))],
+            edges=[],
+            memoize=True,
+        )
+        executor._get_node_inputs = lambda node_id: {"a": 1, "b": 1}
+        assert executor._run_node("m").value == 2
+
+        executor._get_node_inputs = lambda node_id: {"a": True, "b": 1}
+        assert executor._run_node("m").success is False
+
+    def test_memo_hits_do_not_alias_earlier_results(self):
+        """Mutating one run's metadata does not leak into the next run."""
+        nodes = [
+            Node(id="n", type="number_input", data=NodeData(label="N", config={"value": 7})),
+        ]
+        executor = GraphExecutor(nodes=nodes, edges=[], memoize=True)
+
+        first = executor.execute()
+        first["n"]["metadata"]["tampered"] = True
+        second = executor.execute()
+
+        assert "tampered" not in second["n"]["metadata"]
+        assert second["n"]["metadata"] is not first["n"]["metadata"]
+
+    def test_memo_is_off_by_default(self, monkeypatch):
+        """Without memoize=True every execute() runs the blocks again."""
+        calls = self._count_runs(monkeypatch)
+        nodes = [
+            Node(id="n", type="number_input", data=NodeData(label="N", config={"value": 7})),
+        ]
+        executor = GraphExecutor(nodes=nodes, edges=[])
+
+        executor.execute()
+        executor.execute()
+
+        assert calls == ["n", "n"]
@@ -2,6 +2,8 @@
 Unit tests for Input Block processors (TextInputBlock, NumberInputBlock).
 """
 
+import logging
+
 import pytest
 from app.blocks.io.input_blocks import TextInputBlock, NumberInputBlock
 from app.blocks.base import BlockResult
@@ -85,6 +87,33 @@ class TestTextInputBlock:
         assert result.success is True
         assert result.value == ""
 
+    def test_reassigned_config_is_revalidated(self):
+        """Test that replacing the config re-runs the length check."""
+        block = TextInputBlock(
+            node_id="text8",
+            config={"value": "Short", "max_length": 10}
+        )
+        assert block.run({}).metadata["length"] == 5
+
+        block.config = {"value": "This is a long text", "max_length": 10}
+        result = block.run({})
+
+        assert result.success is False
+        assert "exceeds maximum" in result.error
+
+    def test_unexpected_config_error_is_logged(self, caplog):
+        """Test an unexpected error while checking config is logged and reported."""
+        with caplog.at_level(logging.ERROR, logger="app.blocks.io.input_blocks"):
+            block = TextInputBlock(
+                node_id="text9",
+                config={"value": "Short", "max_length": "ten"}
+            )
+        result = block.run({})
+
+        assert result.success is False
+        assert result.error.startswith("Unexpected error:")
+        assert "Error in TextInputBlock text9" in caplog.text
+
 
 class TestNumberInputBlock:
     """Test cases for NumberInputBlock."""
@@ -170,6 +199,64 @@ class TestNumberInputBlock:
         assert result.success is True
         assert result.value == 1.5e10
 
+    def test_auto_detect_integer_string(self):
+        """Test auto-detection keeps whole-number strings as int."""
+        block = NumberInputBlock(
+            node_id="num7b",
+            config={"value": "42", "number_type": "auto"}
+        )
+        result = block.run({})
+        
+        assert result.success is True
+        assert result.value == 42
+        assert isinstance(result.value, int)
+
+    def test_auto_detect_float_string(self):
+        """Test auto-detection falls back to float for decimal strings."""
+        block = NumberInputBlock(
+            node_id="num7c",
+            config={"value": "2.5", "number_type": "auto"}
+        )
+        result = block.run({})
+        
+        assert result.success is True
+        assert result.value == 2.5
+        assert isinstance(result.value, float)
+
+    def test_auto_detect_invalid_string(self):
+        """Test auto-detection reports strings that are not numbers."""
+        block = NumberInputBlock(
+            node_id="num7d",
+            config={"value": "twelve", "number_type": "auto"}
+        )
+        result = block.run({})
+        
+        assert result.success is False
+        assert "Cannot convert" in result.error
+
+    @pytest.mark.parametrize("raw", ["nan", "inf", "-Infinity", "1e999"])
+    def test_auto_detect_rejects_non_finite_strings(self, raw):
+        """Test auto-detection rejects strings that parse to NaN or infinity."""
+        block = NumberInputBlock(
+            node_id="num7e",
+            config={"value": raw, "number_type": "auto", "min_value": 0, "max_value": 10}
+        )
+        result = block.run({})
+
+        assert result.success is False
+        assert result.error == f"Cannot convert '{raw}' to number"
+
+    def test_auto_detect_accepts_underscore_literal(self):
+        """Test auto-detection reads '1_000' as int, like int mode does."""
+        block = NumberInputBlock(
+            node_id="num7f",
+            config={"value": "1_000", "number_type": "auto"}
+        )
+        result = block.run({})
+
+        assert result.success is True
+        assert result.value == 1000
+
     def test_min_value_constraint(self):
         """Test min_value constraint."""
         block = NumberInputBlock(
@@ -192,6 +279,19 @@ class TestNumberInputBlock:
         assert result.success is False
         assert "exceeds maximum" in result.error
 
+    def test_unexpected_config_error_is_logged(self, caplog):
+        """Test an unexpected error while resolving config is logged and reported."""
+        with caplog.at_level(logging.ERROR, logger="app.blocks.io.input_blocks"):
+            block = NumberInputBlock(
+                node_id="num9b",
+                config={"value": 5, "min_value": "low"}
+            )
+        result = block.run({})
+
+        assert result.success is False
+        assert result.error.startswith("Unexpected error:")
+        assert "Error in NumberInputBlock num9b" in caplog.text
+
     def test_value_within_range(self):
         """Test value within min/max range."""
         block = NumberInputBlock(
@@ -232,3 +332,17 @@ class TestNumberInputBlock:
         
         assert result.success is True
         assert result.value == -42
+
+    def test_reassigned_config_is_reparsed(self):
+        """Test that replacing the config re-runs conversion and range checks."""
+        block = NumberInputBlock(
+            node_id="num14",
+            config={"value": "5", "number_type": "int", "max_value": 10}
+        )
+        assert block.run({}).value == 5
+
+        block.config = {"value": "50", "number_type": "int", "max_value": 10}
+        result = block.run({})
+
+        assert result.success is False
+        assert "exceeds maximum" in result.error
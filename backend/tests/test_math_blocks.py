@@ -6,19 +6,29 @@ edge cases (division by zero, non-numeric inputs, missing inputs, large numbers)
 Pydantic config validation, and registry integration through the GraphExecutor.
 """
 
+import functools
+import itertools
+import operator
+
 import pytest
 from pydantic import ValidationError
 from typing import Dict, Any
 
+from app.blocks.logic import math_blocks
 from app.blocks.logic.math_blocks import MathOperationBlock
 from app.blocks.base import BlockResult
-from app.schemas import MathBlockConfig
+from app.engine.graph_executor import GraphExecutor
+from app.schemas import Edge, MathBlockConfig, Node, NodeData
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Relative tolerance for results that are not exactly representable floats
+FLOAT_REL = 1e-12
+
+
 def _make_block(operation: str) -> MathOperationBlock:
     """Create a MathOperationBlock pre-configured with a given operation."""
     return MathOperationBlock(
@@ -27,162 +37,71 @@ def _make_block(operation: str) -> MathOperationBlock:
     )
 
 
-def _run(operation: str, a: Any, b: Any) -> BlockResult:
-    """Convenience: create block, run with inputs a and b, return BlockResult."""
-    block = _make_block(operation)
-    return block.run({"a": a, "b": b})
-
-
-# ---------------------------------------------------------------------------
-# Addition
-# ---------------------------------------------------------------------------
-
-class TestAddOperation:
-    """Tests for the 'add' operation."""
-
-    def test_add_integers(self):
-        """3 + 4 should return 7 as int."""
-        result = _run("add", 3, 4)
-        assert result.success is True
-        assert result.value == 7
-        assert isinstance(result.value, int)
+@functools.lru_cache(maxsize=None)
+def _shared_block(operation: str) -> MathOperationBlock:
+    """One block per operation, shared by ``_run``; ``run()`` never mutates it.
 
-    def test_add_floats(self):
-        """1.5 + 2.5 should return 4.0 as float."""
-        result = _run("add", 1.5, 2.5)
-        assert result.success is True
-        assert result.value == 4.0
-        assert isinstance(result.value, float)
-
-    def test_add_int_and_float(self):
-        """int + float should return float."""
-        result = _run("add", 2, 3.5)
-        assert result.success is True
-        assert result.value == 5.5
-        assert isinstance(result.value, float)
+    Tests that replace a block's config or patch it use ``_make_block``.
+    """
+    return _make_block(operation)
 
-    def test_add_negative_numbers(self):
-        """-5 + 3 should return -2."""
-        result = _run("add", -5, 3)
-        assert result.success is True
-        assert result.value == -2
-
-    def test_add_zeros(self):
-        """0 + 0 should return 0."""
-        result = _run("add", 0, 0)
-        assert result.success is True
-        assert result.value == 0
-
-
-# ---------------------------------------------------------------------------
-# Subtraction
-# ---------------------------------------------------------------------------
-
-class TestSubtractOperation:
-    """Tests for the 'subtract' operation."""
-
-    def test_subtract_integers(self):
-        """10 - 3 should return 7 as int."""
-        result = _run("subtract", 10, 3)
-        assert result.success is True
-        assert result.value == 7
-        assert isinstance(result.value, int)
-
-    def test_subtract_floats(self):
-        """5.5 - 2.5 = 3.0 as float."""
-        result = _run("subtract", 5.5, 2.5)
-        assert result.success is True
-        assert result.value == 3.0
-        assert isinstance(result.value, float)
-
-    def test_subtract_negative_result(self):
-        """3 - 10 should return -7."""
-        result = _run("subtract", 3, 10)
-        assert result.success is True
-        assert result.value == -7
 
-
-# ---------------------------------------------------------------------------
-# Multiplication
-# ---------------------------------------------------------------------------
-
-class TestMultiplyOperation:
-    """Tests for the 'multiply' operation."""
-
-    def test_multiply_integers(self):
-        """6 × 7 should return 42 as int."""
-        result = _run("multiply", 6, 7)
-        assert result.success is True
-        assert result.value == 42
-        assert isinstance(result.value, int)
-
-    def test_multiply_floats(self):
-        """2.5 × 4.0 should return 10.0 as float."""
-        result = _run("multiply", 2.5, 4.0)
-        assert result.success is True
-        assert result.value == 10.0
-        assert isinstance(result.value, float)
-
-    def test_multiply_by_zero(self):
-        """Any number × 0 should return 0 (not an error)."""
-        result = _run("multiply", 99, 0)
-        assert result.success is True
-        assert result.value == 0
-
-    def test_multiply_negative(self):
-        """-3 × 4 should return -12."""
-        result = _run("multiply", -3, 4)
-        assert result.success is True
-        assert result.value == -12
+def _run(operation: str, a: Any, b: Any) -> BlockResult:
+    """Convenience: run the shared block for *operation* with inputs a and b."""
+    return _shared_block(operation).run({"a": a, "b": b})
 
 
 # ---------------------------------------------------------------------------
-# Division
+# Arithmetic Operations
 # ---------------------------------------------------------------------------
 
-class TestDivideOperation:
-    """Tests for the 'divide' operation."""
-
-    def test_divide_exact(self):
-        """10 ÷ 2 should return 5 as int (type-preserved)."""
-        result = _run("divide", 10, 2)
-        assert result.success is True
-        assert result.value == 5
-        assert isinstance(result.value, int)
-
-    def test_divide_float_result(self):
-        """7 ÷ 2 should return 3.5 as float."""
-        result = _run("divide", 7, 2)
+# (operation, a, b, expected value, expected result type)
+ARITH_CASES = [
+    pytest.param("add", 3, 4, 7, int, id="add-integers"),
+    pytest.param("add", 1.5, 2.5, 4.0, float, id="add-floats"),
+    pytest.param("add", 2, 3.5, 5.5, float, id="add-int-and-float"),
+    pytest.param("add", -5, 3, -2, int, id="add-negative-numbers"),
+    pytest.param("add", 0, 0, 0, int, id="add-zeros"),
+    pytest.param("subtract", 10, 3, 7, int, id="subtract-integers"),
+    pytest.param("subtract", 5.5, 2.5, 3.0, float, id="subtract-floats"),
+    pytest.param("subtract", 3, 10, -7, int, id="subtract-negative-result"),
+    pytest.param("multiply", 6, 7, 42, int, id="multiply-integers"),
+    pytest.param("multiply", 2.5, 4.0, 10.0, float, id="multiply-floats"),
+    pytest.param("multiply", 99, 0, 0, int, id="multiply-by-zero"),
+    pytest.param("multiply", -3, 4, -12, int, id="multiply-negative"),
+    # Exact int division is type-preserved; float inputs are never promoted
+    pytest.param("divide", 10, 2, 5, int, id="divide-exact"),
+    pytest.param("divide", 7, 2, 3.5, float, id="divide-float-result"),
+    pytest.param("divide", 9.0, 3.0, 3.0, float, id="divide-float-exact-not-promoted"),
+    pytest.param("divide", 10, -2, -5, int, id="divide-by-negative"),
+]
+
+
+class TestArithmeticOperations:
+    """Tests for the four arithmetic operations."""
+
+    @pytest.mark.parametrize("operation, a, b, expected, expected_type", ARITH_CASES)
+    def test_operation(self, operation, a, b, expected, expected_type):
+        """Each operation returns the expected value and result type."""
+        result = _run(operation, a, b)
         assert result.success is True
-        assert result.value == 3.5
-        assert isinstance(result.value, float)
-
-    def test_divide_float_exact_result_not_promoted_to_int(self):
-        """9.0 ÷ 3.0 should return float (inputs are float, no type-preservation)."""
-        result = _run("divide", 9.0, 3.0)
-        assert result.success is True
-        assert result.value == 3.0
-        assert isinstance(result.value, float)
-
-    def test_divide_by_negative(self):
-        """10 ÷ -2 should return -5."""
-        result = _run("divide", 10, -2)
-        assert result.success is True
-        assert result.value == -5
-
-    def test_divide_by_zero_integer(self):
-        """Division by integer zero should fail with ZeroDivisionError message."""
-        result = _run("divide", 7, 0)
+        assert result.value == expected
+        assert type(result.value) is expected_type
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            pytest.param(7, 0, id="integer-zero"),
+            pytest.param(7.0, 0.0, id="float-zero"),
+        ],
+    )
+    def test_divide_by_zero(self, a, b):
+        """Division by zero should fail with ZeroDivisionError message."""
+        result = _run("divide", a, b)
         assert result.success is False
         assert result.value is None
         assert "zero" in result.error.lower()  # type: ignore[union-attr]  # error always set on failure
 
-    def test_divide_by_zero_float(self):
-        """Division by float zero should fail with ZeroDivisionError message."""
-        result = _run("divide", 7.0, 0.0)
-        assert result.success is False
-        assert result.value is None
-        assert "zero" in result.error.lower()  # type: ignore[union-attr]  # error always set on failure
 
 # ---------------------------------------------------------------------------
 # Type Preservation
@@ -237,6 +156,19 @@ class TestErrorHandling:
         assert result.success is False
         assert result.value is None
 
+    def test_bool_input_a_rejected(self):
+        """bool is an int subclass but must not be accepted as a number."""
+        result = _run("add", True, 2)
+        assert result.success is False
+        assert result.value is None
+        assert "bool" in result.error
+
+    def test_bool_input_b_rejected(self):
+        """bool operands are rejected on either side."""
+        result = _run("multiply", 3, False)
+        assert result.success is False
+        assert "bool" in result.error
+
     def test_missing_input_a(self):
         """Missing 'a' key should fail with KeyError info."""
         block = _make_block("add")
@@ -262,6 +194,11 @@ class TestErrorHandling:
         assert result.success is False
         assert result.value is None
 
+    def test_missing_input_error_is_unquoted(self):
+        """The error carries the KeyError message without repr() quoting."""
+        result = _make_block("add").run({"a": 5})
+        assert result.error == "Required input 'b' is missing from inputs."
+
     def test_none_input_a(self):
         """None value for 'a' should fail with TypeError info."""
         result = _run("add", None, 2)
@@ -327,6 +264,243 @@ class TestMathBlockConfigSchema:
         assert any(op in error_str for op in ("add", "subtract", "multiply", "divide"))
 
 
+# ---------------------------------------------------------------------------
+# Config Caching
+# ---------------------------------------------------------------------------
+
+class TestConfigCaching:
+    """MathBlockConfig is validated once per block, not once per run."""
+
+    def test_config_validated_once_across_runs(self, monkeypatch):
+        """Repeated run() calls must not re-validate an unchanged config."""
+        block = _make_block("add")
+        calls = []
+        original = MathBlockConfig.model_validate
+        monkeypatch.setattr(
+            MathBlockConfig,
+            "model_validate",
+            lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs),
+        )
+        for _ in range(3):
+            assert block.run({"a": 1, "b": 2}).value == 3
+        assert calls == []
+
+    def test_replaced_config_is_revalidated(self):
+        """Swapping self.config for a new dict takes effect on the next run."""
+        block = _make_block("add")
+        block.config = {"operation": "multiply"}
+        result = block.run({"a": 3, "b": 4})
+        assert result.success is True
+        assert result.value == 12
+
+    def test_replaced_invalid_config_fails_gracefully(self):
+        """A replacement config that fails validation is reported, not raised."""
+        block = _make_block("add")
+        block.config = {"operation": "power"}
+        result = block.run({"a": 3, "b": 4})
+        assert result.success is False
+        assert result.error
+
+    def test_from_trusted_config(self):
+        """from_trusted_config builds a working block without validation."""
+        block = MathOperationBlock.from_trusted_config(
+            node_id="math-trusted", config={"operation": "subtract"}
+        )
+        result = block.run({"a": 10, "b": 4})
+        assert result.success is True
+        assert result.value == 6
+
+
+# ---------------------------------------------------------------------------
+# Batch Execution
+# ---------------------------------------------------------------------------
+
+class TestRunBatch:
+    """MathOperationBlock.run_batch applies the operation element-wise."""
+
+    def test_batch_multiply(self):
+        """Each operand pair is combined with the configured operation."""
+        result = _make_block("multiply").run_batch([1, 2, 3], [4, 5, 6])
+        assert result.success is True
+        assert result.value == [4, 10, 18]
+        assert result.metadata == {"operation": "multiply", "batch_size": 3}
+
+    def test_batch_length_mismatch(self):
+        """Operand batches of different lengths are rejected."""
+        result = _make_block("add").run_batch([1, 2], [1])
+        assert result.success is False
+        assert "length" in result.error
+
+    def test_batch_divide_by_zero(self):
+        """A zero divisor anywhere in a list batch fails the whole batch."""
+        result = _make_block("divide").run_batch([1, 2], [1, 0])
+        assert result.success is False
+        assert "zero" in result.error.lower()
+
+    def test_batch_divide_preserves_int(self):
+        """Whole int/int quotients stay int, as in run()."""
+        result = _make_block("divide").run_batch([4, 5, 4.0], [2, 2, 2])
+        assert result.value == [2, 2.5, 2.0]
+        assert [type(v) for v in result.value] == [int, float, float]
+
+    def test_batch_rejects_bool(self):
+        """bool operands are rejected element-wise, as in run()."""
+        result = _make_block("add").run_batch([1, True], [1, 1])
+        assert result.success is False
+        assert result.error == "Batch operand 'a[1]' must be numeric (int or float), got bool."
+
+    def test_batch_overflow_fails_gracefully(self):
+        """An OverflowError is reported in the result, as in run()."""
+        block = _make_block("divide")
+        expected = block.run({"a": 10**400, "b": 1})
+        result = block.run_batch([10**400], [1])
+        assert result.success is False
+        assert result.error == expected.error == "Unexpected error: OverflowError"
+
+    def test_batch_unsized_operands_fail_gracefully(self):
+        """Operands without a length are reported, not raised."""
+        result = _make_block("add").run_batch(iter([1]), [1])
+        assert result.success is False
+        assert "len" in result.error
+
+    def test_batch_invalid_config(self):
+        """Invalid configuration is reported the same way as in run()."""
+        block = MathOperationBlock(node_id="math-bad", config={"operation": "power"})
+        result = block.run_batch([1], [2])
+        assert result.success is False
+
+
+# ---------------------------------------------------------------------------
+# Metadata Collection
+# ---------------------------------------------------------------------------
+
+class TestMetadataCollection:
+    """COLLECT_METADATA turns off metadata construction without changing values."""
+
+    def test_metadata_skipped_when_disabled(self, monkeypatch):
+        """With collection disabled, results carry the value but no metadata."""
+        monkeypatch.setattr(math_blocks, "COLLECT_METADATA", False)
+        result = _make_block("add").run({"a": 2, "b": 3})
+        assert result.success is True
+        assert result.value == 5
+        assert result.metadata is None
+
+    def test_batch_metadata_skipped_when_disabled(self, monkeypatch):
+        """run_batch honours the same switch."""
+        monkeypatch.setattr(math_blocks, "COLLECT_METADATA", False)
+        result = _make_block("add").run_batch([1, 2], [3, 4])
+        assert result.value == [4, 6]
+        assert result.metadata is None
+
+
+# ---------------------------------------------------------------------------
+# Fused Chains
+# ---------------------------------------------------------------------------
+
+class TestFuseChain:
+    """fuse_chain composes a left-deep chain into one equivalent function."""
+
+    @staticmethod
+    def _run_sequentially(ops, operands):
+        value = operands[0]
+        for op, operand in zip(ops, operands[1:]):
+            value = _make_block(op).run({"a": value, "b": operand}).value
+        return value
+
+    @pytest.mark.parametrize(
+        "ops, operands",
+        [
+            (["add", "multiply", "divide"], [1, 2, 4, 3]),
+            (["divide", "multiply"], [4, 2, 3]),
+            (["divide", "multiply"], [5, 2, 2]),
+            (["subtract", "add"], [1.5, 0.5, 2]),
+        ],
+    )
+    def test_matches_sequential_execution(self, ops, operands):
+        """Values and result types match running the blocks one by one."""
+        fused = math_blocks.fuse_chain([_make_block(op) for op in ops])
+        expected = self._run_sequentially(ops, operands)
+        actual = fused(*operands)
+        assert actual == expected
+        assert type(actual) is type(expected)
+
+    def test_errors_are_raised(self):
+        """Non-numeric operands and zero divisors raise instead of wrapping."""
+        fused = math_blocks.fuse_chain([_make_block("add"), _make_block("divide")])
+        with pytest.raises(TypeError):
+            fused(True, 1, 1)
+        with pytest.raises(ZeroDivisionError):
+            fused(1, 1, 0)
+
+    def test_wrong_operand_count_raises(self):
+        """The fused function takes exactly one more operand than blocks."""
+        fused = math_blocks.fuse_chain([_make_block("add")])
+        with pytest.raises(TypeError):
+            fused(1, 2, 3)
+
+    def test_fused_function_is_named_after_the_chain(self):
+        """The function name lists the chain's operations, not its code."""
+        fused = math_blocks.fuse_chain([_make_block("add"), _make_block("divide")])
+        assert fused.__name__ == fused.__qualname__ == "fused_add_divide"
+        assert fused.__doc__ is None
+
+    def test_kernel_matches_run(self):
+        """kernel() computes the same values and types as run()."""
+        block = _make_block("divide")
+        kernel = block.kernel()
+        for a, b in [(10, 2), (7, 2), (6.0, 3)]:
+            expected = block.run({"a": a, "b": b}).value
+            assert kernel(a, b) == expected
+            assert type(kernel(a, b)) is type(expected)
+
+    def test_kernel_follows_replaced_config(self):
+        """kernel() re-reads a replaced config and rejects an invalid one."""
+        block = _make_block("add")
+        block.config = {"operation": "multiply"}
+        assert block.kernel()(3, 4) == 12
+        assert block.operation == "multiply"
+        block.config = {"operation": "power"}
+        with pytest.raises(ValueError):
+            block.kernel()
+
+    def test_invalid_chain_rejected(self):
+        """Empty chains and blocks with invalid config cannot be fused."""
+        with pytest.raises(ValueError):
+            math_blocks.fuse_chain([])
+        bad = MathOperationBlock(node_id="bad", config={"operation": "power"})
+        with pytest.raises(ValueError):
+            math_blocks.fuse_chain([bad])
+
+
+# ---------------------------------------------------------------------------
+# Reference Oracle
+# ---------------------------------------------------------------------------
+
+# Plain Python operators as ground truth for a grid of mixed int/float operands
+_ORACLE = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+_GRID = [-7, -1, 0, 1, 2, 3, 12, 10 ** 12, -2.5, -0.1, 0.0, 0.5, 1.0, 3.75, 1e-9, 6.02e23]
+
+
+class TestReferenceOracle:
+    """Cross-check every operation against Python's operators over an operand grid."""
+
+    @pytest.mark.parametrize("operation", list(_ORACLE))
+    def test_matches_operator_module(self, operation):
+        """Block values equal the operator result; int ÷ int may become int."""
+        reference = _ORACLE[operation]
+        for a, b in itertools.product(_GRID, repeat=2):
+            if operation == "divide" and b == 0:
+                continue
+            result = _run(operation, a, b)
+            assert result.success is True, (a, b)
+            assert result.value == reference(a, b), (a, b)
+
+
 # ---------------------------------------------------------------------------
 # Large Numbers
 # ---------------------------------------------------------------------------
@@ -346,12 +520,14 @@ class TestLargeNumbers:
         result = _run("multiply", 1.23e10, 4.56e10)
         assert result.success is True
         assert isinstance(result.value, float)
+        assert result.value == pytest.approx(5.6088e20, rel=FLOAT_REL)
 
     def test_small_float_division(self):
         """Very small float division does not error."""
         result = _run("divide", 1.0, 1e-15)
         assert result.success is True
         assert isinstance(result.value, float)
+        assert result.value == pytest.approx(1e15, rel=FLOAT_REL)
 
 
 # ---------------------------------------------------------------------------
@@ -381,48 +557,49 @@ class TestBlockResultMetadata:
 # Registry Integration (via GraphExecutor)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def executor_results():
+    """Results of running num-a (6) and num-b (7) into a multiply node, once per module."""
+    nodes = [
+        Node(
+            id="num-a",
+            type="number_input",
+            data=NodeData(label="A", config={"value": 6}),
+        ),
+        Node(
+            id="num-b",
+            type="number_input",
+            data=NodeData(label="B", config={"value": 7}),
+        ),
+        Node(
+            id="math1",
+            type="math_operation",
+            data=NodeData(label="Multiply", config={"operation": "multiply"}),
+        ),
+    ]
+    edges = [
+        Edge(id="e1", source="num-a", target="math1", targetHandle="a"),
+        Edge(id="e2", source="num-b", target="math1", targetHandle="b"),
+    ]
+
+    return GraphExecutor(nodes=nodes, edges=edges).execute()
+
+
 class TestRegistryIntegration:
     """Verify MathOperationBlock is reachable through the GraphExecutor dispatcher."""
 
-    def test_math_operation_dispatched_by_executor(self):
+    def test_all_nodes_present(self, executor_results):
         """GraphExecutor._instantiate_block should resolve 'math_operation' without error."""
-        from app.engine.graph_executor import GraphExecutor
-        from app.schemas import Node, NodeData, Edge
-
-        nodes = [
-            Node(
-                id="num-a",
-                type="number_input",
-                data=NodeData(label="A", config={"value": 6}),
-            ),
-            Node(
-                id="num-b",
-                type="number_input",
-                data=NodeData(label="B", config={"value": 7}),
-            ),
-            Node(
-                id="math1",
-                type="math_operation",
-                data=NodeData(label="Multiply", config={"operation": "multiply"}),
-            ),
-        ]
-        edges = [
-            Edge(id="e1", source="num-a", target="math1", targetHandle="a"),
-            Edge(id="e2", source="num-b", target="math1", targetHandle="b"),
-        ]
-
-        executor = GraphExecutor(nodes=nodes, edges=edges)
-        results = executor.execute()
-
-        # All three nodes should be present
-        assert "num-a" in results
-        assert "num-b" in results
-        assert "math1" in results
-
-        # Number input nodes should succeed
-        assert results["num-a"]["success"] is True
-        assert results["num-b"]["success"] is True
-
-        # Math operation should succeed: 6 × 7 = 42
-        assert results["math1"]["success"] is True
-        assert results["math1"]["value"] == 42
+        assert "num-a" in executor_results
+        assert "num-b" in executor_results
+        assert "math1" in executor_results
+
+    def test_number_inputs_succeed(self, executor_results):
+        """Number input nodes feeding the math node should succeed."""
+        assert executor_results["num-a"]["success"] is True
+        assert executor_results["num-b"]["success"] is True
+
+    def test_math_value(self, executor_results):
+        """Math operation should succeed: 6 × 7 = 42."""
+        assert executor_results["math1"]["success"] is True
+        assert executor_results["math1"]["value"] == 42
@@ -2,11 +2,18 @@
 Unit tests for Output Block processors (TextOutputBlock, NumberOutputBlock).
 """
 
+import json
+
 import pytest
 from app.blocks.io.output_blocks import TextOutputBlock, NumberOutputBlock
 from app.blocks.base import BlockResult
 
 
+# Exact expected renderings for the JSON format tests (2-space indent)
+EXPECTED_DICT_JSON = '{\n  "name": "Alice",\n  "age": 30\n}'
+EXPECTED_LIST_JSON = "[\n  1,\n  2,\n  3,\n  4,\n  5\n]"
+
+
 class TestTextOutputBlock:
     """Test cases for TextOutputBlock."""
 
@@ -32,8 +39,7 @@ class TestTextOutputBlock:
         result = block.run({"input1": input_dict})
         
         assert result.success is True
-        assert '"name"' in result.value
-        assert '"Alice"' in result.value
+        assert result.value == EXPECTED_DICT_JSON
         assert result.metadata["format"] == "json"
 
     def test_json_format_list(self):
@@ -46,9 +52,57 @@ class TestTextOutputBlock:
         result = block.run({"input1": input_list})
         
         assert result.success is True
-        assert "[" in result.value
+        assert result.value == EXPECTED_LIST_JSON
         assert result.metadata["format"] == "json"
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_json_format_matches_stdlib_layout(self, monkeypatch, use_orjson):
+        """JSON output round-trips and keeps the 2-space indented layout."""
+        from app.blocks.io import output_blocks
+
+        if not use_orjson:
+            monkeypatch.setattr(output_blocks, "orjson", None)
+        elif output_blocks.orjson is None:
+            pytest.skip("orjson is not installed")
+        block = TextOutputBlock(node_id="out3b", config={"format": "json"})
+        input_dict = {"name": "Alice", "tags": ["a", "b"]}
+        result = block.run({"input1": input_dict})
+
+        assert result.success is True
+        assert json.loads(result.value) == input_dict
+        assert result.value == json.dumps(input_dict, indent=2)
+
+    def test_json_stdlib_fallback_matches_json_dumps(self, monkeypatch):
+        """Without orjson the output is exactly json.dumps(value, indent=2)."""
+        from app.blocks.io import output_blocks
+
+        monkeypatch.setattr(output_blocks, "orjson", None)
+        block = TextOutputBlock(node_id="out3c", config={"format": "json"})
+        value = {"city": "東京", "score": float("nan"), "big": 1e16, "wide": 2**70}
+        result = block.run({"input1": value})
+
+        assert result.value == json.dumps(value, indent=2)
+
+    def test_json_orjson_exponent_floats(self):
+        """orjson writes exponent-form floats without the stdlib's '+'."""
+        from app.blocks.io import output_blocks
+
+        if output_blocks.orjson is None:
+            pytest.skip("orjson is not installed")
+        block = TextOutputBlock(node_id="out3d", config={"format": "json"})
+        result = block.run({"input1": [1e16, 1.5e-7]})
+
+        assert result.value == "[\n  1e16,\n  1.5e-7\n]"
+
+    def test_json_oversized_int_uses_stdlib_encoder(self):
+        """Ints wider than 64 bits are encoded by the stdlib, whole payload included."""
+        block = TextOutputBlock(node_id="out3e", config={"format": "json"})
+        value = [2**70, 1e16]
+        result = block.run({"input1": value})
+
+        assert result.success is True
+        assert result.value == json.dumps(value, indent=2)
+
     def test_pretty_format(self):
         """Test pretty formatting with type information."""
         block = TextOutputBlock(
@@ -114,22 +168,26 @@ class TestTextOutputBlock:
         assert result.value == "True"
 
 
+@pytest.fixture(scope="module")
+def default_number_block():
+    """One default-config NumberOutputBlock shared by tests that only call run()."""
+    return NumberOutputBlock(node_id="num_out_default", config={})
+
+
 class TestNumberOutputBlock:
     """Test cases for NumberOutputBlock."""
 
-    def test_integer_output(self):
+    def test_integer_output(self, default_number_block):
         """Test integer output."""
-        block = NumberOutputBlock(node_id="num_out1", config={})
-        result = block.run({"input1": 42})
+        result = default_number_block.run({"input1": 42})
         
         assert result.success is True
         assert result.value == "42"
         assert result.metadata["type"] == "int"
 
-    def test_float_output(self):
+    def test_float_output(self, default_number_block):
         """Test float output."""
-        block = NumberOutputBlock(node_id="num_out2", config={})
-        result = block.run({"input1": 3.14159})
+        result = default_number_block.run({"input1": 3.14159})
         
         assert result.success is True
         assert "3.14159" in result.value
@@ -145,6 +203,14 @@ class TestNumberOutputBlock:
         assert result.success is True
         assert result.value == "3.14"
 
+    def test_decimal_places_follow_config_replacement(self):
+        """Replacing the config dict rebuilds the cached format specs."""
+        block = NumberOutputBlock(node_id="num3b", config={"decimal_places": 2})
+        assert block.run({"input1": 3.14159}).value == "3.14"
+
+        block.config = {"decimal_places": 4}
+        assert block.run({"input1": 3.14159}).value == "3.1416"
+
     def test_thousands_separator(self):
         """Test thousands separator."""
         block = NumberOutputBlock(
@@ -157,6 +223,24 @@ class TestNumberOutputBlock:
         assert "," in result.value
         assert result.value == "1,000,000"
 
+    def test_thousands_separator_with_decimal_places(self):
+        """Separators and fixed decimal places come from one format spec."""
+        block = NumberOutputBlock(
+            node_id="num_out4b",
+            config={"use_thousands_separator": True, "decimal_places": 2}
+        )
+        result = block.run({"input1": 123456.789})
+
+        assert result.success is True
+        assert result.value == "123,456.79"
+
+    def test_thousands_separator_small_float_in_exponent_form(self, default_number_block):
+        """Floats whose repr uses an exponent are formatted, not rejected."""
+        result = default_number_block.run({"input1": 0.00001})
+
+        assert result.success is True
+        assert result.value == "1e-05"
+
     def test_scientific_notation(self):
         """Test scientific notation formatting."""
         block = NumberOutputBlock(
@@ -179,70 +263,62 @@ class TestNumberOutputBlock:
         assert result.success is True
         assert "e" in result.value.lower()
 
-    def test_nan_handling(self):
+    def test_nan_handling(self, default_number_block):
         """Test NaN special value handling."""
-        block = NumberOutputBlock(node_id="num_out7", config={})
-        result = block.run({"input1": float('nan')})
+        result = default_number_block.run({"input1": float('nan')})
         
         assert result.success is True
         assert result.value == "NaN"
         assert result.metadata["is_special"] is True
         assert result.metadata["special_type"] == "NaN"
 
-    def test_infinity_handling(self):
+    def test_infinity_handling(self, default_number_block):
         """Test positive infinity handling."""
-        block = NumberOutputBlock(node_id="num_out8", config={})
-        result = block.run({"input1": float('inf')})
+        result = default_number_block.run({"input1": float('inf')})
         
         assert result.success is True
         assert result.value == "∞"
         assert result.metadata["is_special"] is True
 
-    def test_negative_infinity_handling(self):
+    def test_negative_infinity_handling(self, default_number_block):
         """Test negative infinity handling."""
-        block = NumberOutputBlock(node_id="num_out9", config={})
-        result = block.run({"input1": float('-inf')})
+        result = default_number_block.run({"input1": float('-inf')})
         
         assert result.success is True
         assert result.value == "-∞"
         assert result.metadata["is_special"] is True
 
-    def test_string_to_number_conversion(self):
+    def test_string_to_number_conversion(self, default_number_block):
         """Test automatic conversion from string to number."""
-        block = NumberOutputBlock(node_id="num_out10", config={})
-        result = block.run({"input1": "123.45"})
+        result = default_number_block.run({"input1": "123.45"})
         
         assert result.success is True
         assert "123.45" in result.value
 
-    def test_invalid_input_type_error(self):
+    def test_invalid_input_type_error(self, default_number_block):
         """Test error for invalid input type."""
-        block = NumberOutputBlock(node_id="num_out11", config={})
-        result = block.run({"input1": "not a number"})
+        result = default_number_block.run({"input1": "not a number"})
         
         assert result.success is False
         assert "Cannot convert" in result.error
 
-    def test_no_input_error(self):
+    def test_no_input_error(self, default_number_block):
         """Test error when no input is provided."""
-        block = NumberOutputBlock(node_id="num_out12", config={})
-        result = block.run({})
+        result = default_number_block.run({})
         
         assert result.success is False
         assert "No input provided" in result.error
 
-    def test_negative_number_output(self):
+    def test_negative_number_output(self, default_number_block):
         """Test negative number formatting."""
-        block = NumberOutputBlock(node_id="num_out13", config={})
-        result = block.run({"input1": -42})
+        result = default_number_block.run({"input1": -42})
         
         assert result.success is True
         assert result.value == "-42"
 
-    def test_zero_output(self):
+    def test_zero_output(self, default_number_block):
         """Test zero value output."""
-        block = NumberOutputBlock(node_id="num_out14", config={})
-        result = block.run({"input1": 0})
+        result = default_number_block.run({"input1": 0})
         
         assert result.success is True
         assert result.value == "0"
@@ -13,9 +13,12 @@ Tests cover:
 - Registry integration via GraphExecutor dispatcher
 """
 
+import logging
+
 import pytest
 from typing import Dict, Any
 
+from app.blocks.logic import text_blocks
 from app.blocks.logic.text_blocks import TextJoinBlock
 from app.blocks.base import BlockResult
 from app.schemas import TextJoinConfig
@@ -75,6 +78,12 @@ class TestTextJoinBasicJoining:
         assert result.success is True
         assert result.value == "col1\tcol2"
 
+    def test_join_escape_inside_longer_separator(self):
+        """Escapes embedded in a longer separator are translated as well."""
+        result = _run({"a": "a", "b": "b"}, separator=",\\n")
+        assert result.success is True
+        assert result.value == "a,\nb"
+
     def test_join_real_newline_separator(self):
         """['a', 'b'] with a real '\\n' char in config still works."""
         result = _run({"a": "a", "b": "b"}, separator="\n")
@@ -201,6 +210,37 @@ class TestTextJoinTypeCoercion:
         assert result.success is True
         assert result.value == "1 two 3.0"
 
+    def test_failing_str_is_reported(self, caplog):
+        """A __str__ returning a non-string fails with its TypeError, which is logged."""
+        class BadStr:
+            def __str__(self):
+                return 42
+
+        with caplog.at_level(logging.ERROR, logger="app.blocks.logic.text_blocks"):
+            result = _run({"a": BadStr(), "b": "x"})
+        assert result.success is False
+        assert "non-string" in result.error
+        assert result.error in caplog.text
+
+    def test_other_str_errors_are_unexpected(self):
+        """Exceptions other than TypeError from __str__ use the generic handler."""
+        class BrokenStr:
+            def __str__(self):
+                raise RuntimeError("boom")
+
+        result = _run({"a": BrokenStr(), "b": "x", "c": "y"})
+        assert result.success is False
+        assert result.error == "Unexpected error: RuntimeError"
+
+    def test_debug_logging_path_matches_inlined_path(self, caplog):
+        """Coercion gives the same output whether or not DEBUG logging is on."""
+        inputs = {"a": 1, "b": None, "c": "x"}
+        plain = _run(inputs, separator="|")
+        with caplog.at_level(logging.DEBUG, logger="app.blocks.logic.text_blocks"):
+            traced = _run(inputs, separator="|")
+        assert plain.value == traced.value == "1||x"
+        assert "coerced" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # Class: TestTextJoinNoneHandling
@@ -254,6 +294,50 @@ class TestTextJoinDefaultSeparator:
         assert result.value == "HelloWorld"
 
 
+# ---------------------------------------------------------------------------
+# Class: TestTextJoinConfigCaching
+# ---------------------------------------------------------------------------
+
+class TestTextJoinConfigCaching:
+    """TextJoinConfig is validated once per block, not once per run."""
+
+    def test_replaced_config_is_revalidated(self):
+        """Swapping self.config for a new dict takes effect on the next run."""
+        block = _make_block(separator=" ")
+        block.config = {"separator": "-"}
+        result = block.run({"a": "x", "b": "y"})
+        assert result.success is True
+        assert result.value == "x-y"
+
+    def test_separator_resolved_once_per_config(self, monkeypatch):
+        """Escape sequences are resolved when the config is loaded, not per run."""
+        calls = []
+        original = text_blocks._resolve_separator
+
+        def counting_resolve(raw):
+            calls.append(raw)
+            return original(raw)
+
+        monkeypatch.setattr(text_blocks, "_resolve_separator", counting_resolve)
+        block = _make_block(separator="\\n")
+        for _ in range(3):
+            assert block.run({"a": "x", "b": "y"}).value == "x\ny"
+        assert calls == ["\\n"]
+
+        block.config = {"separator": "\\t"}
+        assert block.run({"a": "x", "b": "y"}).value == "x\ty"
+        assert calls == ["\\n", "\\t"]
+
+    def test_from_trusted_config(self):
+        """from_trusted_config builds a working block without validation."""
+        block = TextJoinBlock.from_trusted_config(
+            node_id="join-trusted", config={"separator": "+"}
+        )
+        result = block.run({"a": "1", "b": "2"})
+        assert result.success is True
+        assert result.value == "1+2"
+
+
 # ---------------------------------------------------------------------------
 # Class: TestTextJoinMetadata
 # ---------------------------------------------------------------------------
@@ -283,6 +367,15 @@ class TestTextJoinMetadata:
         # Should be the literal backslash-n, not a real newline
         assert result.metadata["separator"] == "\\n"
 
+    def test_metadata_dict_not_shared_between_runs(self):
+        """Each run gets its own metadata dict, even though one block is reused."""
+        block = _make_block(separator=" ")
+        first = block.run({"a": "x", "b": "y"})
+        first.metadata["input_count"] = 99
+        second = block.run({"a": "x", "b": "y"})
+        assert second.metadata is not first.metadata
+        assert second.metadata["input_count"] == 2
+
     def test_metadata_three_inputs(self):
         """Three inputs: input_count = 3."""
         result = _run({"a": "1", "b": "2", "c": "3"}, separator=",")